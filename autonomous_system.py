@@ -31,6 +31,9 @@ logging.basicConfig(
     ]
 )
 
+# Seconds components get to exit after terminate() before they are killed
+SHUTDOWN_TIMEOUT = 10
+
 class AutonomousAISystem:
     def __init__(self):
         self.running = False
@@ -205,19 +208,28 @@ class AutonomousAISystem:
         """Gracefully shut down the system"""
         logging.info("\n🛑 Shutting down Autonomous Personal AI Employee System...")
 
-        # Terminate all processes
+        # Terminate all processes first so they shut down in parallel
+        stopping = []
         for component_name, component_info in self.components.items():
             if component_info['process']:
                 try:
                     component_info['process'].terminate()
-                    component_info['process'].wait(timeout=10)  # Wait up to 10 seconds
-                    logging.info(f"{component_name} terminated successfully")
-                except subprocess.TimeoutExpired:
-                    component_info['process'].kill()  # Force kill if it doesn't terminate
-                    logging.warning(f"{component_name} killed forcefully")
+                    stopping.append((component_name, component_info['process']))
                 except Exception as e:
                     logging.error(f"Error terminating {component_name}: {e}")
 
+        # Then wait on them against one shared deadline
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        for component_name, process in stopping:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+                logging.info(f"{component_name} terminated successfully")
+            except subprocess.TimeoutExpired:
+                process.kill()  # Force kill if it doesn't terminate
+                logging.warning(f"{component_name} killed forcefully")
+            except Exception as e:
+                logging.error(f"Error terminating {component_name}: {e}")
+
         logging.info("[OK] Autonomous Personal AI Employee System shut down successfully!")
         self.running = False
         sys.exit(0)
@@ -6,6 +6,7 @@ This module aligns tasks with business goals and scores them for strategic value
 """
 
 import os
+import re
 import time
 from pathlib import Path
 from datetime import datetime
@@ -31,6 +32,19 @@ business_goals_path = Path(VAULT_PATH) / BUSINESS_GOALS_FILE
 memory_path = Path(VAULT_PATH) / MEMORY_FOLDER
 logs_path = Path(VAULT_PATH) / LOGS_FOLDER
 
+# Line types in Business_Goals.md (leading/trailing whitespace ignored):
+# document title, "## Goal", "- **Priority:** x", "- **Keywords:** a, b", description text
+GOAL_LINE_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<skip>#.*Business Goals.*?)"
+    r"|##[ \t]*(?P<title>.*?)"
+    r"|- \*\*Priority:\*\*[ \t]*(?P<priority>.*?)"
+    r"|- \*\*Keywords:\*\*[ \t]*(?P<keywords>.*?)"
+    r"|(?P<text>[^\-\s].*?)"
+    r")[ \t\r]*$",
+    re.MULTILINE,
+)
+
 class BusinessGoalAlignmentEngine:
     def __init__(self):
         self.setup_memory_directory()
@@ -46,39 +60,35 @@ class BusinessGoalAlignmentEngine:
         goals = []
         if business_goals_path.exists():
             try:
-                with open(business_goals_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Parse goals from markdown
-                lines = content.split('\n')
+                # Read raw bytes and decode once rather than through a text-mode reader
+                with open(business_goals_path, 'rb') as f:
+                    content = f.read().decode('utf-8')
+
+                # Parse goals from markdown: one scan, dispatch on the matched line type
                 current_goal = None
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('#') and 'Business Goals' in line:
-                        continue
-                    elif line.startswith('##'):
+                for match in GOAL_LINE_RE.finditer(content):
+                    kind = match.lastgroup
+                    if kind == 'title':
                         # New goal section
-                        goal_title = line[2:].strip()  # Remove ##
                         current_goal = {
-                            'title': goal_title,
+                            'title': match.group('title'),
                             'description': '',
                             'keywords': [],
                             'priority': 'medium'
                         }
                         goals.append(current_goal)
-                    elif line.startswith('- **Priority:**'):
-                        if current_goal:
-                            current_goal['priority'] = line.replace('- **Priority:**', '').strip().lower()
-                    elif line.startswith('- **Keywords:**'):
-                        if current_goal:
-                            keywords_str = line.replace('- **Keywords:**', '').strip()
-                            current_goal['keywords'] = [k.strip() for k in keywords_str.split(',')]
-                    elif current_goal and line and not line.startswith('-'):
+                    elif current_goal is None or kind == 'skip':
+                        continue
+                    elif kind == 'priority':
+                        current_goal['priority'] = match.group('priority').lower()
+                    elif kind == 'keywords':
+                        current_goal['keywords'] = [k.strip() for k in match.group('keywords').split(',')]
+                    elif kind == 'text':
                         # Add to description
                         if current_goal['description']:
-                            current_goal['description'] += ' ' + line
+                            current_goal['description'] += ' ' + match.group('text')
                         else:
-                            current_goal['description'] = line
+                            current_goal['description'] = match.group('text')
             except Exception as e:
                 print(f"Error loading business goals: {e}")
         
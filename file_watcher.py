@@ -195,17 +195,21 @@ def check_inbox(processed_files):
     print(f"[{datetime.now().strftime('%H:%M:%S')}] Scanning Inbox folder...")
 
     try:
-        # Get all files in the inbox folder
-        inbox_files = list(inbox_path.glob('*'))
+        # Snapshot the inbox entries (files are moved out while we loop); each
+        # DirEntry already knows whether it is a directory, so no stat per file
+        with os.scandir(inbox_path) as entries:
+            inbox_entries = list(entries)
 
         # Count new files processed in this scan
         new_files_count = 0
 
-        for file_path in inbox_files:
+        for entry in inbox_entries:
             # Skip directories
-            if file_path.is_dir():
+            if entry.is_dir():
                 continue
 
+            file_path = Path(entry.path)
+
             # Check if this file has already been processed
             if file_path in processed_files:
                 continue
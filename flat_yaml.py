@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Flat YAML frontmatter for Personal AI Employee System
+
+Task frontmatter is almost always a flat block of `key: scalar` lines. Those
+are parsed and emitted here without PyYAML, with the same typing rules as
+yaml.safe_load; anything else (nesting, lists, quoting, block scalars,
+comments after values, octal/sexagesimal numbers...) returns None so the
+caller falls back to PyYAML. Shared by the loop, self-correction, risk radar
+and plan generator so every tool reads the same frontmatter the same way.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Optional
+
+FLAT_LINE_RE = re.compile(r'([A-Za-z_][\w-]*):(?:[ \t]+(.*?))?[ \t]*\Z')
+INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9]*)\Z')
+FLOAT_RE = re.compile(r'(?:[-+]?[0-9]+\.[0-9]*|\.[0-9]+)\Z')
+DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}\Z')
+DATETIME_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?\Z')
+YAML_NULLS = {'', '~', 'null', 'Null', 'NULL'}
+YAML_BOOLS = {
+    **dict.fromkeys(('yes', 'Yes', 'YES', 'true', 'True', 'TRUE', 'on', 'On', 'ON'), True),
+    **dict.fromkeys(('no', 'No', 'NO', 'false', 'False', 'FALSE', 'off', 'Off', 'OFF'), False),
+}
+# First characters that make a plain scalar mean something else in YAML
+NON_PLAIN_START = set('-?:,[]{}#&*!|>\'"%@`<=.+0123456789')
+# yaml.dump folds plain scalars at a space once a line passes this column
+YAML_LINE_WIDTH = 80
+
+_NOT_FLAT = object()
+
+
+def _parse_flat_scalar(value: str):
+    """Type a plain scalar the way yaml.safe_load would, or return _NOT_FLAT"""
+    if value in YAML_NULLS:
+        return None
+    if value in YAML_BOOLS:
+        return YAML_BOOLS[value]
+    if INT_RE.match(value):
+        return int(value)
+    if FLOAT_RE.match(value):
+        return float(value)
+    if DATETIME_RE.match(value):
+        return datetime.fromisoformat(value)
+    if DATE_RE.match(value):
+        return date.fromisoformat(value)
+    if value[0] in NON_PLAIN_START or ': ' in value or ' #' in value or '\t#' in value or value.endswith(':'):
+        return _NOT_FLAT
+    return value
+
+
+def parse_flat_yaml(yaml_content: str) -> Optional[dict]:
+    """
+    Parse a flat `key: scalar` YAML block without PyYAML
+
+    A block of only blank and comment lines gives {} (yaml.safe_load gives None).
+
+    Returns:
+        dict, or None when the block needs a full YAML parser
+    """
+    data = {}
+    for line in yaml_content.splitlines():
+        if not line.strip() or line.startswith('#'):
+            continue
+        match = FLAT_LINE_RE.match(line)
+        if not match or match.group(1) in YAML_BOOLS or match.group(1) in YAML_NULLS:
+            return None
+        value = _parse_flat_scalar(match.group(2) or '')
+        if value is _NOT_FLAT:
+            return None
+        data[match.group(1)] = value
+    return data
+
+
+def dump_flat_scalar(value, quote: bool = True) -> Optional[str]:
+    """
+    Render a scalar as yaml.dump would, without PyYAML
+
+    Args:
+        value: Scalar to render
+        quote (bool): Single-quote strings that are not plain scalars; when
+            False those return None instead
+
+    Returns:
+        str, or None if the value needs PyYAML
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        text = repr(value)
+        return text if FLOAT_RE.match(text) else None
+    if isinstance(value, datetime):
+        return value.isoformat(' ') if value.tzinfo is None else None
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        if not value.isascii() or not value.isprintable():
+            return None
+        if value == value.strip() and _parse_flat_scalar(value) == value:
+            return value
+        if quote:
+            return "'" + value.replace("'", "''") + "'"
+    return None
+
+
+def is_flat_key(key) -> bool:
+    """True if key can be written as a plain `key:` without PyYAML"""
+    return (isinstance(key, str) and FLAT_LINE_RE.match(key + ':') is not None
+            and key not in YAML_BOOLS and key not in YAML_NULLS)
+
+
+def dump_flat_yaml(data: dict, sort_keys: bool = False, exact: bool = False) -> Optional[str]:
+    """
+    Emit a flat dict as block YAML without PyYAML
+
+    Args:
+        data (dict): Flat mapping to emit
+        sort_keys (bool): Emit keys sorted, as yaml.dump does by default,
+            instead of in dict order
+        exact (bool): Only emit output byte-identical to yaml.dump; strings
+            that need quoting and lines yaml.dump would fold return None
+
+    Returns:
+        str, or None when a key or value needs PyYAML
+    """
+    for key in data:
+        if not is_flat_key(key):
+            return None
+
+    lines = []
+    for key, value in (sorted(data.items()) if sort_keys else data.items()):
+        rendered = dump_flat_scalar(value, quote=not exact)
+        if rendered is None:
+            return None
+        line = f"{key}: {rendered}\n"
+        if exact and len(line) > YAML_LINE_WIDTH and ' ' in rendered:
+            return None
+        lines.append(line)
+    return ''.join(lines)
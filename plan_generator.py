@@ -16,17 +16,22 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+from flat_yaml import parse_flat_yaml
+
 VAULT_PATH = Path(__file__).parent
 PLANS_DIR = VAULT_PATH / "Plans"
 INCOMING_DIR = VAULT_PATH / "01_Incoming_Tasks"
@@ -93,43 +98,137 @@ TASK_TYPE_TEMPLATES: Dict[str, List[str]] = {
 }
 
 
+# Plan document layout; filled in by create_plan()
+PLAN_TEMPLATE = """---
+plan_id: PLAN_{task_id}
+task_id: {task_id}
+title: "{title}"
+task_type: {task_type}
+priority: {priority}
+created: {created}
+status: in_progress
+total_steps: {total_steps}
+completed_steps: 0
+{source_task_line}---
+
+# Plan: {title}
+
+**Created:** {created_display}
+**Task ID:** `{task_id}`
+**Type:** {type_display}
+**Priority:** {priority_display}
+
+---
+
+## Objective
+
+{objective}
+
+---
+
+## Steps
+
+{steps_md}
+
+---
+
+## Progress
+
+`[{progress_bar}]` 0 / {total_steps} steps complete
+
+---
+
+## Notes
+
+*(Add notes here as you work through the plan)*
+
+---
+
+## Completion
+
+When all steps are checked, update frontmatter: `status: completed`
+Then move this file to `Done/` or `03_Completed_Tasks/`.
+
+---
+*Generated by Plan Generator — {created}*
+"""
+
+
+# Frontmatter block at the very top of a task file
+_FM_HEAD_BYTES = 4096
+_FM_RE = re.compile(r"\A---\r?\n(.*?)\r?\n---", re.DOTALL)
+
+
+def _parse_simple_frontmatter(block: str) -> Dict:
+    """Fallback parser when PyYAML is not installed: `key: value` lines as strings."""
+    result = {}
+    for line in block.splitlines():
+        if ":" in line:
+            k, _, v = line.partition(":")
+            result[k.strip()] = v.strip()
+    return result
+
+
 def parse_task_frontmatter(task_file: Path) -> Dict:
     """Parse YAML frontmatter from a task file."""
     try:
-        content = task_file.read_text(encoding="utf-8")
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                if yaml:
-                    return yaml.safe_load(parts[1]) or {}
-                else:
-                    # Simple fallback parser
-                    result = {}
-                    for line in parts[1].strip().splitlines():
-                        if ":" in line:
-                            k, _, v = line.partition(":")
-                            result[k.strip()] = v.strip()
-                    return result
+        # Frontmatter sits at the top of the file; only read past the first
+        # chunk when the closing marker has not been seen yet.
+        with open(task_file, "rb") as f:
+            head = f.read(_FM_HEAD_BYTES)
+            if not head.startswith(b"---"):
+                return {}
+            end = head.find(b"\n---", 3)
+            if end == -1:
+                head += f.read()
+                end = head.find(b"\n---", 3)
+                if end == -1:
+                    return {}
+        content = head[:end + 4].decode("utf-8")
+        match = _FM_RE.match(content)
+        if match:
+            block = match.group(1)
+            # Flat key: value blocks (the common case) skip PyYAML entirely
+            metadata = parse_flat_yaml(block)
+            if metadata is not None:
+                return metadata
+            if yaml:
+                return yaml.safe_load(block) or {}
+            return _parse_simple_frontmatter(block)
     except Exception:
         pass
     return {}
 
 
-def get_default_steps(task_type: str, description: str = "") -> List[str]:
-    """Get default steps for a task type, with optional description-based augmentation."""
+# Description keywords that add extra steps, one named group per step
+_STEP_KEYWORDS_RE = re.compile(
+    r"(?P<billing>invoice|billing|\$)"
+    r"|(?P<calendar>schedule|calendar|meeting)"
+    r"|(?P<follow_up>follow[- ]up|reminder)",
+    re.IGNORECASE,
+)
+_KEYWORD_STEPS = (
+    ("billing", "Update Accounting records in Odoo or accounting log"),
+    ("calendar", "Create or update calendar event"),
+    ("follow_up", "Set follow-up reminder in 3 days"),
+)
+
+
+@lru_cache(maxsize=256)
+def _steps_for(task_type: str, description: str) -> Tuple[str, ...]:
+    """Memoised step list for a (task_type, description) pair."""
     base_steps = TASK_TYPE_TEMPLATES.get(task_type, TASK_TYPE_TEMPLATES["manual"])
 
-    # Augment steps based on description keywords
-    extra_steps = []
-    desc_lower = description.lower()
-    if any(w in desc_lower for w in ["invoice", "billing", "$"]):
-        extra_steps.append("Update Accounting records in Odoo or accounting log")
-    if any(w in desc_lower for w in ["schedule", "calendar", "meeting"]):
-        extra_steps.append("Create or update calendar event")
-    if any(w in desc_lower for w in ["follow up", "follow-up", "reminder"]):
-        extra_steps.append("Set follow-up reminder in 3 days")
+    # Augment steps based on description keywords (single scan)
+    matched = {m.lastgroup for m in _STEP_KEYWORDS_RE.finditer(description)}
+    extra_steps = [step for group, step in _KEYWORD_STEPS if group in matched]
+
+    return tuple(base_steps) + tuple(extra_steps)
+
 
-    return base_steps + extra_steps
+def get_default_steps(task_type: str, description: str = "") -> List[str]:
+    """Get default steps for a task type, with optional description-based augmentation."""
+    return list(_steps_for(task_type, description))
 
 
 def create_plan(
@@ -161,77 +260,58 @@ def create_plan(
     plan_file = PLANS_DIR / f"PLAN_{task_id}.md"
 
     now = datetime.now()
+    content = PLAN_TEMPLATE.format(
+        task_id=task_id,
+        title=title,
+        task_type=task_type,
+        priority=priority,
+        created=now.isoformat(),
+        created_display=now.strftime('%Y-%m-%d %H:%M:%S'),
+        total_steps=len(steps),
+        source_task_line=f"source_task: \"{source_task_file}\"\n" if source_task_file else "",
+        type_display=task_type.replace('_', ' ').title(),
+        priority_display=priority.title(),
+        objective=description or title,
+        steps_md="\n".join(f"- [ ] {step}" for step in steps),
+        progress_bar="░" * len(steps),
+    )
 
-    # Build YAML frontmatter
-    frontmatter_lines = [
-        "---",
-        f"plan_id: PLAN_{task_id}",
-        f"task_id: {task_id}",
-        f"title: \"{title}\"",
-        f"task_type: {task_type}",
-        f"priority: {priority}",
-        f"created: {now.isoformat()}",
-        f"status: in_progress",
-        f"total_steps: {len(steps)}",
-        f"completed_steps: 0",
-    ]
-    if source_task_file:
-        frontmatter_lines.append(f"source_task: \"{source_task_file}\"")
-    frontmatter_lines.append("---")
-
-    # Build step checkboxes
-    steps_md = "\n".join(f"- [ ] {step}" for step in steps)
-
-    # Build progress indicator
-    progress_bar = "░" * len(steps)
-
-    content = "\n".join(frontmatter_lines) + f"""
-
-# Plan: {title}
-
-**Created:** {now.strftime('%Y-%m-%d %H:%M:%S')}
-**Task ID:** `{task_id}`
-**Type:** {task_type.replace('_', ' ').title()}
-**Priority:** {priority.title()}
-
----
-
-## Objective
-
-{description or title}
-
----
-
-## Steps
-
-{steps_md}
-
----
+    plan_file.write_text(content, encoding="utf-8")
+    print(f"[Plan Generator] Created: {plan_file.name}")
+    return plan_file
 
-## Progress
 
-`[{progress_bar}]` 0 / {len(steps)} steps complete
+# Step checkboxes at the start of a line: "- [ ]", "- [x]" or "- [X]"
+_CHECKBOX_RE = re.compile(r"^- \[(?P<state>[ xX])\]", re.MULTILINE)
+_PROGRESS_RE = re.compile(r"`\[.*?\]`.*steps complete.*")
 
----
 
-## Notes
+# Top-level `key: value` line inside a frontmatter block
+_FM_LINE_RE = re.compile(r"^(?P<key>[A-Za-z_][\w-]*):.*$", re.MULTILINE)
 
-*(Add notes here as you work through the plan)*
 
----
+def _set_frontmatter_fields(content: str, fields: Dict) -> str:
+    """
+    Set top-level frontmatter keys with one pass over the frontmatter block.
 
-## Completion
+    Existing keys are rewritten in place, missing keys are appended to the
+    end of the block; the rest of the document is left untouched.
+    """
+    match = _FM_RE.match(content)
+    if not match:
+        return content
 
-When all steps are checked, update frontmatter: `status: completed`
-Then move this file to `Done/` or `03_Completed_Tasks/`.
+    pending = dict(fields)
 
----
-*Generated by Plan Generator — {now.isoformat()}*
-"""
+    def _replace(m):
+        key = m.group("key")
+        if key in pending:
+            return f"{key}: {pending.pop(key)}"
+        return m.group(0)
 
-    plan_file.write_text(content, encoding="utf-8")
-    print(f"[Plan Generator] Created: {plan_file.name}")
-    return plan_file
+    block = _FM_LINE_RE.sub(_replace, match.group(1))
+    block += "".join(f"\n{k}: {v}" for k, v in pending.items())
+    return content[:match.start(1)] + block + content[match.end(1):]
 
 
 def update_plan_progress(plan_file: Path) -> Dict:
@@ -240,9 +320,10 @@ def update_plan_progress(plan_file: Path) -> Dict:
 
     Returns dict with total, completed, percentage.
     """
-    content = plan_file.read_text(encoding="utf-8")
-    total = content.count("- [ ]") + content.count("- [x]") + content.count("- [X]")
-    completed = content.count("- [x]") + content.count("- [X]")
+    original = plan_file.read_text(encoding="utf-8")
+    counts = Counter(m.group("state") for m in _CHECKBOX_RE.finditer(original))
+    completed = counts["x"] + counts["X"]
+    total = completed + counts[" "]
     pct = int((completed / total * 100)) if total else 0
 
     # Update progress bar
@@ -251,33 +332,32 @@ def update_plan_progress(plan_file: Path) -> Dict:
     new_progress = f"`[{bar}]` {completed} / {total} steps complete ({pct}%)"
 
     # Replace old progress line
-    content = re.sub(
-        r"`\[.*?\]`.*steps complete.*",
-        new_progress,
-        content
-    )
-
-    # Update frontmatter fields
-    if yaml:
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            fm = yaml.safe_load(parts[1]) or {}
-            fm["completed_steps"] = completed
-            fm["total_steps"] = total
-            if completed == total and total > 0:
-                fm["status"] = "completed"
-                fm["completed_at"] = datetime.now().isoformat()
-            new_fm = yaml.dump(fm, default_flow_style=False)
-            content = f"---\n{new_fm}---{parts[2]}"
-
-    plan_file.write_text(content, encoding="utf-8")
+    content = _PROGRESS_RE.sub(new_progress, original)
+
+    # Update frontmatter fields in place rather than re-dumping the whole block
+    fields = {"completed_steps": completed, "total_steps": total}
+    if completed == total and total > 0:
+        fields["status"] = "completed"
+        if not re.search(r"^completed_at:", content, flags=re.M):
+            fields["completed_at"] = datetime.now().isoformat()
+    content = _set_frontmatter_fields(content, fields)
+
+    if content != original:
+        plan_file.write_text(content, encoding="utf-8")
     return {"total": total, "completed": completed, "percentage": pct}
 
 
 def auto_generate_plans():
     """Scan Incoming and Needs_Action for tasks that don't have a plan yet."""
     generated = 0
-    existing_plan_ids = {p.stem.replace("PLAN_", "") for p in PLANS_DIR.glob("PLAN_*.md")} if PLANS_DIR.exists() else set()
+    try:
+        with os.scandir(PLANS_DIR) as entries:
+            existing_plan_ids = {
+                e.name[5:-3] for e in entries
+                if e.name.startswith("PLAN_") and e.name.endswith(".md")
+            }
+    except FileNotFoundError:
+        existing_plan_ids = set()
 
     for folder in [INCOMING_DIR, NEEDS_ACTION_DIR]:
         if not folder.exists():
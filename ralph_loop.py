@@ -7,24 +7,58 @@ until they reach completion status, with a maximum of 10 retries.
 Enhanced with intelligence from task_intelligence module.
 """
 
+import atexit
 import time
 import os
+import random
+import re
 from pathlib import Path
 from datetime import datetime
 import yaml
 import json
 from typing import Dict, List, Optional
+from collections import Counter
 import logging
-
-# Configure logging
+import logging.handlers
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from flat_yaml import dump_flat_scalar, dump_flat_yaml, is_flat_key, parse_flat_yaml
+
+# Configure logging: file records are buffered and written every LOG_BUFFER_CAPACITY
+# records, on any WARNING or above, and at exit
+LOG_BUFFER_CAPACITY = 200
+_log_file_handler = logging.FileHandler('Logs/ralph_loop.log')
+_log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_buffer_handler = logging.handlers.MemoryHandler(
+    capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=_log_file_handler
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('Logs/ralph_loop.log'),
+        _log_buffer_handler,
         logging.StreamHandler()
     ]
 )
+atexit.register(_log_buffer_handler.flush)
 
 # Configuration constants
 VAULT_PATH = r"C:\Users\laptop world\Desktop\Hack00"
@@ -45,9 +79,115 @@ failed_tasks_path = Path(VAULT_PATH) / FAILED_TASKS_FOLDER
 logs_path = Path(VAULT_PATH) / LOGS_FOLDER
 memory_path = Path(VAULT_PATH) / MEMORY_FOLDER
 
+# Worker threads used to process the tasks of one folder concurrently
+MAX_WORKERS = 8
+
+# Seconds between cycles when polling, and between safety rescans when watching folders
+POLL_INTERVAL = 30
+WATCH_RESCAN_INTERVAL = 300
+
+# Pause between back-to-back cycles while moved tasks are still waiting to be processed
+BUSY_POLL_INTERVAL = 0.1
+
+# Seconds after which folders that looked settled are scanned again regardless of their mtime
+FOLDER_RESCAN_INTERVAL = 300
+
+# Delay after a failed cycle, doubled for each consecutive failure up to the cap
+ERROR_RETRY_DELAY = 60
+MAX_ERROR_RETRY_DELAY = 3600
+# Delay before retrying a cycle that hit a malformed YAML/JSON file
+PARSE_ERROR_RETRY_DELAY = 5
+# Consecutive unexpected (non-I/O) errors tolerated before the loop stops
+MAX_UNEXPECTED_FAILURES = 5
+
+# os.rename raises FileExistsError on Windows instead of replacing the target
+RENAME_REFUSES_OVERWRITE = os.name == 'nt'
+
+# Marker in RalphLoop._own_writes for a path the loop is writing right now
+OWN_WRITE_PENDING = -1
+
+# Leading "---" block of a task file: group 1 is the YAML, group 2 the body
+FRONTMATTER_RE = re.compile(r'\A---[^\n]*\n(.*?)^---[^\n]*(?:\n|\Z)(.*)', re.DOTALL | re.MULTILINE)
+
+
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_indented(obj) -> bytes:
+    """Encode obj exactly as json.dumps(obj, indent=2) would, using orjson when possible"""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        # json.dumps escapes non-ASCII; keep that so other readers decode it the same way
+        if data.isascii():
+            return data
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def set_frontmatter_values(content: str, fields: dict) -> Optional[str]:
+    """
+    Rewrite just the `key: value` lines of a flat frontmatter block
+
+    Existing keys are edited in place and new keys are appended to the
+    block; every other line of the file is left exactly as it was.
+
+    Returns:
+        str, or None when the frontmatter is missing or not flat, or a value needs PyYAML
+    """
+    match = FRONTMATTER_RE.match(content)
+    if not match or not match.group(1) or parse_flat_yaml(match.group(1)) is None:
+        return None
+
+    block = match.group(1)
+    for key, value in fields.items():
+        rendered = dump_flat_scalar(value)
+        if rendered is None or not is_flat_key(key):
+            return None
+        line = f"{key}: {rendered}"
+        block, count = re.subn(rf'^{re.escape(key)}:.*$', lambda _: line, block, flags=re.MULTILINE)
+        if count > 1:
+            return None
+        if count == 0:
+            block += line + "\n"
+    return content[:match.start(1)] + block + content[match.end(1):]
+
+
 class RalphLoop:
     def __init__(self):
         self.max_retries = 10
+        # Parsed frontmatter keyed by path -> (mtime_ns, size, yaml_data, body)
+        self._metadata_cache: Dict[str, tuple] = {}
+        # stat results captured while listing folders, consumed once by get_task_metadata
+        self._dirent_stats: Dict[str, os.stat_result] = {}
+        # task file name -> retry count, rebuilt once per cycle from the retry logs
+        self._retry_index: Optional[Counter] = None
+        # Metadata updates collected during a cycle, written once per file on flush
+        self._pending_updates: Dict[str, dict] = {}
+        # Guards the staged updates, which worker threads share during a cycle
+        self._pending_lock = threading.Lock()
+        # Set by the folder watcher to cut the wait between cycles short
+        self._wake_event = threading.Event()
+        # Path -> mtime_ns it had right after the current cycle wrote or moved it (None once
+        # moved away, OWN_WRITE_PENDING mid-write); the folder watcher ignores events on a
+        # path still in that state, so later outside edits to it are noticed
+        self._own_writes: Dict[str, Optional[int]] = {}
+        # Destination folders already created by move_task_to_folder
+        self._ensured_folders = set()
+        # Tasks moved between folders, and task files rewritten, during the current cycle
+        self._cycle_moves = 0
+        self._cycle_writes = 0
+        # Folder -> directory mtime when a pass over it last changed nothing
+        self._settled_folders: Dict[str, int] = {}
+        # Folders the watcher saw modified by something other than the loop
+        self._touched_folders = set()
+        self._watching = False
+        self._last_full_scan = time.monotonic()
+        self.intelligence_data = {}
+        # Pattern key -> (mtime_ns, size) of its file at the last load_intelligence
+        self._intel_signatures: Dict[str, Optional[tuple]] = {}
         self.setup_logs_directory()
         self.load_intelligence()
 
@@ -56,26 +196,39 @@ class RalphLoop:
         logs_path.mkdir(parents=True, exist_ok=True)
         failed_tasks_path.mkdir(parents=True, exist_ok=True)
 
-    def load_intelligence(self):
-        """Load intelligence data from memory"""
-        self.intelligence_data = {}
-        # Load success patterns
-        success_file = memory_path / "success_patterns.json"
-        if success_file.exists():
+    def load_intelligence(self) -> bool:
+        """
+        Load intelligence data from memory
+
+        Each pattern file is only re-read when its mtime/size has changed
+        since the last load, so idle cycles skip the JSON parse.
+
+        Returns:
+            bool: True if any pattern file was reloaded or removed
+        """
+        changed = False
+        for key in ('success_patterns', 'failure_patterns'):
+            pattern_file = memory_path / f"{key}.json"
             try:
-                with open(success_file, 'r') as f:
-                    self.intelligence_data['success_patterns'] = json.load(f)
-            except:
-                self.intelligence_data['success_patterns'] = {}
-
-        # Load failure patterns
-        failure_file = memory_path / "failure_patterns.json"
-        if failure_file.exists():
+                st = pattern_file.stat()
+                signature = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                signature = None
+            if key in self._intel_signatures and self._intel_signatures[key] == signature:
+                continue
+            self._intel_signatures[key] = signature
+            changed = True
+
+            if signature is None:
+                self.intelligence_data.pop(key, None)
+                continue
             try:
-                with open(failure_file, 'r') as f:
-                    self.intelligence_data['failure_patterns'] = json.load(f)
-            except:
-                self.intelligence_data['failure_patterns'] = {}
+                with open(pattern_file, 'rb') as f:
+                    self.intelligence_data[key] = json_loads(f.read())
+            except (OSError, ValueError):
+                # Unreadable, undecodable or malformed JSON
+                self.intelligence_data[key] = {}
+        return changed
 
     def parse_yaml_frontmatter(self, content: str) -> tuple:
         """
@@ -87,20 +240,73 @@ class RalphLoop:
         Returns:
             tuple: (yaml_data dict, content_without_frontmatter str)
         """
-        if content.startswith("---"):
-            # Find the end of YAML frontmatter
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                yaml_content = parts[1]
-                content_without_frontmatter = parts[2].strip()
-                try:
-                    yaml_data = yaml.safe_load(yaml_content)
-                    return yaml_data, content_without_frontmatter
-                except yaml.YAMLError:
-                    # If YAML parsing fails, return empty dict
-                    return {}, content
+        match = FRONTMATTER_RE.match(content)
+        if match:
+            yaml_content, content_without_frontmatter = match.groups()
+            try:
+                yaml_data = parse_flat_yaml(yaml_content)
+                if yaml_data is None:
+                    yaml_data = yaml.load(yaml_content, Loader=YamlLoader)
+                return yaml_data, content_without_frontmatter.strip()
+            except yaml.YAMLError:
+                # If YAML parsing fails, return empty dict
+                return {}, content
         return {}, content
 
+    def list_task_files(self, folder: Path) -> List[Path]:
+        """
+        List the markdown task files in a folder with a single directory scan
+
+        Args:
+            folder (Path): Folder to scan
+
+        Returns:
+            List[Path]: Task files found in the folder
+        """
+        task_files = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.md') and entry.is_file():
+                        try:
+                            # Keep the dirent stat so the metadata cache check needs no extra syscall
+                            st = entry.stat()
+                        except FileNotFoundError:
+                            # Moved or deleted since the scan listed it; keep listing the rest
+                            continue
+                        self._dirent_stats[entry.path] = st
+                        task_files.append(Path(entry.path))
+        except FileNotFoundError:
+            # The folder itself is missing
+            pass
+        return task_files
+
+    def read_task_frontmatter(self, file_path: Path) -> tuple:
+        """
+        Read and parse a task file's frontmatter, reusing the cached parse
+
+        The parse is cached per file and reused until the file's mtime or
+        size changes, so unchanged tasks are not re-read every cycle.
+
+        Args:
+            file_path (Path): Path to the task file
+
+        Returns:
+            tuple: (yaml_data, content_without_frontmatter str)
+        """
+        key = str(file_path)
+        st = self._dirent_stats.pop(key, None) or os.stat(file_path)
+        cached = self._metadata_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        yaml_data, content_without_frontmatter = self.parse_yaml_frontmatter(content)
+        self._metadata_cache[key] = (st.st_mtime_ns, st.st_size, yaml_data, content_without_frontmatter)
+        return yaml_data, content_without_frontmatter
+
     def get_task_metadata(self, file_path: Path) -> dict:
         """
         Get task metadata from YAML frontmatter
@@ -112,11 +318,11 @@ class RalphLoop:
             dict: Task metadata
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            yaml_data, _ = self.parse_yaml_frontmatter(content)
-            return yaml_data or {}
+            yaml_data, _ = self.read_task_frontmatter(file_path)
+            metadata = dict(yaml_data or {})
+            with self._pending_lock:
+                metadata.update(self._pending_updates.get(str(file_path), {}))
+            return metadata
         except Exception as e:
             logging.error(f"Error reading task metadata from {file_path}: {e}")
             return {}
@@ -133,23 +339,34 @@ class RalphLoop:
             bool: True if successful, False otherwise
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            yaml_data, content_without_frontmatter = self.parse_yaml_frontmatter(content)
+            yaml_data, content_without_frontmatter = self.read_task_frontmatter(file_path)
 
             if yaml_data:
-                # Apply updates
-                for key, value in updates.items():
-                    yaml_data[key] = value
-                yaml_data['last_updated'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
+                fields = dict(updates)
+                fields['last_updated'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
 
-                # Reconstruct the file with updated YAML frontmatter
-                updated_content = "---\n" + yaml.dump(yaml_data, default_flow_style=False) + "---\n" + content_without_frontmatter
-
-                # Write the updated content back to the file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(updated_content)
+                self._begin_own_write(file_path)
+                try:
+                    with open(file_path, 'r+', encoding='utf-8') as f:
+                        # Edit only the changed lines when the frontmatter is flat
+                        updated_content = set_frontmatter_values(f.read(), fields)
+                        if updated_content is None:
+                            # Reconstruct the file with updated YAML frontmatter
+                            yaml_data = {**yaml_data, **fields}
+                            frontmatter = dump_flat_yaml(yaml_data)
+                            if frontmatter is None:
+                                frontmatter = yaml.dump(yaml_data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+                            updated_content = "---\n" + frontmatter + "---\n" + content_without_frontmatter
+
+                        # Write the updated content back over the file
+                        f.seek(0)
+                        f.write(updated_content)
+                        f.truncate()
+                finally:
+                    self._end_own_write(file_path)
+                self._metadata_cache.pop(str(file_path), None)
+                with self._pending_lock:
+                    self._cycle_writes += 1
 
                 return True
             else:
@@ -159,6 +376,28 @@ class RalphLoop:
             logging.error(f"Error updating task metadata in {file_path}: {e}")
             return False
 
+    def stage_task_update(self, file_path: Path, updates: dict):
+        """
+        Queue metadata updates for a task, to be written by flush_task_updates
+
+        Several steps of a cycle update the same task; staging them means each
+        file is rewritten once instead of once per step. Staged values are
+        visible through get_task_metadata straight away.
+
+        Args:
+            file_path (Path): Path to the task file
+            updates (dict): Updates to apply to the metadata
+        """
+        with self._pending_lock:
+            self._pending_updates.setdefault(str(file_path), {}).update(updates)
+
+    def flush_task_updates(self):
+        """Write all staged metadata updates, one rewrite per task file"""
+        with self._pending_lock:
+            pending, self._pending_updates = self._pending_updates, {}
+        for file_path, updates in pending.items():
+            self.update_task_metadata(Path(file_path), updates)
+
     def move_task_to_folder(self, task_file_path: Path, destination_folder: Path) -> bool:
         """
         Move a task file to the specified destination folder
@@ -171,28 +410,76 @@ class RalphLoop:
             bool: True if successful, False otherwise
         """
         try:
-            # Ensure destination folder exists
-            destination_folder.mkdir(parents=True, exist_ok=True)
+            # Ensure destination folder exists (once per folder per process)
+            if destination_folder not in self._ensured_folders:
+                destination_folder.mkdir(parents=True, exist_ok=True)
+                self._ensured_folders.add(destination_folder)
 
             # Create destination path
             destination_path = destination_folder / task_file_path.name
 
-            # If a file with the same name already exists, add a timestamp
-            if destination_path.exists():
+            # Move the file; if a file with the same name already exists, add a timestamp
+            try:
+                try:
+                    self._rename_without_overwrite(task_file_path, destination_path)
+                except FileNotFoundError:
+                    if not task_file_path.exists():
+                        raise
+                    # Destination folder was removed since it was created; re-create and retry
+                    destination_folder.mkdir(parents=True, exist_ok=True)
+                    self._rename_without_overwrite(task_file_path, destination_path)
+            except FileExistsError:
                 timestamp = datetime.now().strftime('_%Y%m%d_%H%M%S')
                 stem = task_file_path.stem
                 suffix = task_file_path.suffix
                 new_name = f"{stem}{timestamp}{suffix}"
                 destination_path = destination_folder / new_name
-
-            # Move the file
-            task_file_path.rename(destination_path)
+                self._rename_without_overwrite(task_file_path, destination_path)
+
+            self._metadata_cache.pop(str(task_file_path), None)
+            # Staged updates follow the file to its new location
+            with self._pending_lock:
+                staged = self._pending_updates.pop(str(task_file_path), None)
+                self._cycle_moves += 1
+            if staged:
+                self.stage_task_update(destination_path, staged)
             logging.info(f"Moved task: {task_file_path.name} -> {destination_path.parent.name}/")
             return True
         except Exception as e:
             logging.error(f"Error moving task {task_file_path}: {e}")
             return False
 
+    def _rename_without_overwrite(self, source: Path, destination: Path):
+        """
+        Rename a file, raising FileExistsError instead of replacing an existing one
+
+        Windows' rename already refuses to overwrite, so the collision check
+        costs no extra syscall there; POSIX rename silently replaces, so the
+        destination is checked first.
+        """
+        if not RENAME_REFUSES_OVERWRITE and destination.exists():
+            raise FileExistsError(f"{destination} already exists")
+        self._begin_own_write(source, destination)
+        try:
+            source.rename(destination)
+        finally:
+            self._end_own_write(source, destination)
+
+    def _begin_own_write(self, *paths: Path):
+        """Mark paths the loop is about to change, so the folder watcher ignores their events"""
+        if self._watching:
+            for path in paths:
+                self._own_writes[str(path)] = OWN_WRITE_PENDING
+
+    def _end_own_write(self, *paths: Path):
+        """Record the state the loop left paths in; any later change to them counts as external"""
+        if self._watching:
+            for path in paths:
+                try:
+                    self._own_writes[str(path)] = os.stat(path).st_mtime_ns
+                except OSError:
+                    self._own_writes[str(path)] = None
+
     def log_retry_attempt(self, task_file_path: Path, attempt: int, reason: str):
         """
         Log a retry attempt for a task
@@ -213,38 +500,42 @@ class RalphLoop:
 
         # Load existing logs if file exists
         logs = []
-        if log_file.exists():
-            try:
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-            except:
-                logs = []
+        try:
+            with open(log_file, 'rb') as f:
+                logs = json_loads(f.read())
+        except (OSError, ValueError):
+            logs = []
 
         # Append new log entry
         logs.append(log_entry)
 
         # Write logs back to file
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
-
-    def analyze_retry_history(self, task_file_path: Path) -> int:
-        """Analyze retry history for a task"""
-        retry_count = 0
-        task_name = task_file_path.name
-
-        # Look for retry logs containing this task
+        with open(log_file, 'wb') as f:
+            f.write(json_dumps_indented(logs))
+        if self._retry_index is not None:
+            self._retry_index[log_entry['task_file']] += 1
+
+    def rebuild_retry_index(self):
+        """Count retry log entries per task file once, for lookups during a cycle"""
+        retry_index = Counter()
         for log_file in logs_path.glob("retry_log_*.json"):
             try:
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-
-                for log_entry in logs:
-                    if log_entry.get('task_file') == task_name:
-                        retry_count += 1
-            except:
+                with open(log_file, 'rb') as f:
+                    logs = json_loads(f.read())
+            except (OSError, ValueError):
+                # Unreadable, undecodable or malformed log: skip it
                 continue
 
-        return retry_count
+            if isinstance(logs, list):
+                retry_index.update(e.get('task_file') for e in logs if isinstance(e, dict))
+
+        self._retry_index = retry_index
+
+    def analyze_retry_history(self, task_file_path: Path) -> int:
+        """Analyze retry history for a task"""
+        if self._retry_index is None:
+            self.rebuild_retry_index()
+        return self._retry_index[task_file_path.name]
 
     def apply_intelligence_to_task(self, task_file_path: Path):
         """Apply intelligence to a task based on learned patterns"""
@@ -275,7 +566,7 @@ class RalphLoop:
 
         # Apply updates if any
         if updates:
-            self.update_task_metadata(task_file_path, updates)
+            self.stage_task_update(task_file_path, updates)
 
     def process_task(self, task_file_path: Path) -> str:
         """
@@ -328,7 +619,7 @@ class RalphLoop:
                 if risk_factor > 0.5:
                     # High risk, mark for manual review
                     updates = {'requires_manual_review': True}
-                    self.update_task_metadata(task_file_path, updates)
+                    self.stage_task_update(task_file_path, updates)
                     return 'pending_review'
                 else:
                     return 'in_progress'
@@ -347,7 +638,7 @@ class RalphLoop:
             else:
                 # Low confidence, mark for review
                 updates = {'requires_manual_review': True}
-                self.update_task_metadata(task_file_path, updates)
+                self.stage_task_update(task_file_path, updates)
                 return 'pending_review'
 
     def check_approval_status(self, task_file_path: Path) -> bool:
@@ -363,123 +654,315 @@ class RalphLoop:
         metadata = self.get_task_metadata(task_file_path)
         return metadata.get('approved', False)
 
-    def run_autonomous_cycle(self):
+    def handle_incoming_task(self, task_file: Path):
+        """Process one task from the incoming folder"""
+        metadata = self.get_task_metadata(task_file)
+        status = metadata.get('status', 'pending_review')
+
+        # Only process tasks that aren't already in progress or completed
+        if status in ['pending_review', 'needs_action']:
+            logging.info(f"Processing incoming task: {task_file.name}")
+
+            # Determine new status based on intelligent rules
+            new_status = self.process_task(task_file)
+
+            if new_status == 'awaiting_approval':
+                # Task moved to approval workflows, skip further processing
+                return
+            elif new_status == 'in_progress':
+                # Move to in-progress folder
+                self.move_task_to_folder(task_file, in_progress_tasks_path)
+                # Update the status in the new location
+                new_task_path = in_progress_tasks_path / task_file.name
+                self.stage_task_update(new_task_path, {'status': 'in_progress'})
+            elif new_status == 'completed':
+                # Move directly to completed
+                self.move_task_to_folder(task_file, completed_tasks_path)
+                # Update the status in the new location
+                new_task_path = completed_tasks_path / task_file.name
+                self.stage_task_update(new_task_path, {'status': 'completed'})
+            elif new_status == 'failed':
+                # Already moved to failed tasks by process_task
+                pass
+            else:
+                # Update status in current location
+                self.stage_task_update(task_file, {'status': new_status})
+
+    def handle_in_progress_task(self, task_file: Path):
+        """Process one task from the in-progress folder"""
+        metadata = self.get_task_metadata(task_file)
+        status = metadata.get('status', 'in_progress')
+
+        # Check if task should be completed
+        if status == 'in_progress':
+            # Apply intelligent rules to determine if task is completed
+            new_status = self.process_task(task_file)
+
+            if new_status == 'completed':
+                # Move to completed folder
+                self.move_task_to_folder(task_file, completed_tasks_path)
+                # Update the status in the new location
+                new_task_path = completed_tasks_path / task_file.name
+                self.stage_task_update(new_task_path, {'status': 'completed'})
+            elif new_status == 'awaiting_approval':
+                # Move to approval workflows folder
+                self.move_task_to_folder(task_file, approval_workflows_path)
+            elif new_status == 'failed':
+                # Already moved to failed tasks by process_task
+                pass
+            elif new_status == 'pending_review':
+                # Move back to incoming for review
+                self.move_task_to_folder(task_file, incoming_tasks_path)
+                new_task_path = incoming_tasks_path / task_file.name
+                self.stage_task_update(new_task_path, {'status': 'pending_review'})
+
+    def handle_approval_task(self, task_file: Path):
+        """Process one task from the approval workflows folder"""
+        metadata = self.get_task_metadata(task_file)
+
+        # Check if task has been approved
+        if metadata.get('approved', False):
+            logging.info(f"Approved task: {task_file.name}")
+
+            # Move to in-progress or completed based on original status
+            original_status = metadata.get('original_status', 'in_progress')
+
+            if original_status == 'completed':
+                self.move_task_to_folder(task_file, completed_tasks_path)
+                new_task_path = completed_tasks_path / task_file.name
+                self.stage_task_update(new_task_path, {'status': 'completed'})
+            else:
+                self.move_task_to_folder(task_file, in_progress_tasks_path)
+                new_task_path = in_progress_tasks_path / task_file.name
+                self.stage_task_update(new_task_path, {'status': 'in_progress'})
+
+    def process_folder(self, folder: Path, handler):
+        """
+        Run a per-task handler over every task in a folder, then write staged updates
+
+        Tasks are independent file I/O chains, so they are handled on a
+        thread pool to overlap disk latency.
+
+        Args:
+            folder (Path): Folder to scan
+            handler: Bound method taking the task file path
+        """
+        key = str(folder)
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if not self.folder_needs_scan(folder, mtime):
+            return
+
+        changes_before = self._cycle_moves + self._cycle_writes
+        task_files = self.list_task_files(folder)
+        if len(task_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(task_files))) as executor:
+                list(executor.map(handler, task_files))
+        else:
+            for task_file in task_files:
+                handler(task_file)
+
+        self.flush_task_updates()
+
+        # A pass that changed nothing will change nothing again until the folder does
+        if self._cycle_moves + self._cycle_writes == changes_before:
+            self._settled_folders[key] = mtime
+        else:
+            self._settled_folders.pop(key, None)
+
+    def folder_needs_scan(self, folder: Path, mtime: Optional[int]) -> bool:
+        """
+        Decide whether a folder has to be scanned this cycle
+
+        A folder can be skipped when the last pass over it changed nothing
+        and its directory mtime (which moves when files are added, removed
+        or renamed) is unchanged since. In-place edits do not move the
+        directory mtime, so the watcher marks folders it sees edited, and
+        FOLDER_RESCAN_INTERVAL bounds how long anything else can be missed.
+
+        Args:
+            folder (Path): Task folder
+            mtime (Optional[int]): Current directory mtime in ns (None if missing)
+
+        Returns:
+            bool: True if the folder must be scanned
+        """
+        key = str(folder)
+        if key in self._touched_folders:
+            self._touched_folders.discard(key)
+            return True
+        # Approvals arrive as in-place edits, which only the watcher reports
+        if folder == approval_workflows_path and not self._watching:
+            return True
+        return key not in self._settled_folders or self._settled_folders[key] != mtime
+
+    def run_autonomous_cycle(self) -> dict:
         """
         Run one cycle of the autonomous task processing
+
+        Returns:
+            dict: 'processed' (tasks moved between folders this cycle) and
+                'still_pending' (tasks left in the incoming and in-progress
+                folders, only counted when something was moved)
         """
         logging.info(f"Starting Ralph Loop autonomous cycle")
 
-        # Reload intelligence data
-        self.load_intelligence()
+        # Reload intelligence data; new patterns can change the outcome for any task
+        intelligence_changed = self.load_intelligence()
+        if intelligence_changed or time.monotonic() - self._last_full_scan >= FOLDER_RESCAN_INTERVAL:
+            self._settled_folders.clear()
+            self._last_full_scan = time.monotonic()
+        self._dirent_stats.clear()
+        self._own_writes.clear()
+        self._cycle_moves = 0
+        self._cycle_writes = 0
+        self.rebuild_retry_index()
+
+        # Process incoming, then in-progress, then approval workflow tasks
+        self.process_folder(incoming_tasks_path, self.handle_incoming_task)
+        self.process_folder(in_progress_tasks_path, self.handle_in_progress_task)
+        self.process_folder(approval_workflows_path, self.handle_approval_task)
+
+        still_pending = 0
+        if self._cycle_moves:
+            still_pending = sum(len(self.list_task_files(folder))
+                                for folder in (incoming_tasks_path, in_progress_tasks_path))
+        return {'processed': self._cycle_moves, 'still_pending': still_pending}
+
+    def start_folder_watch(self):
+        """
+        Start watching the task folders so the loop wakes as soon as they change
 
-        # Process incoming tasks
-        incoming_tasks = list(incoming_tasks_path.glob('*.md'))
-        for task_file in incoming_tasks:
-            metadata = self.get_task_metadata(task_file)
-            status = metadata.get('status', 'pending_review')
-
-            # Only process tasks that aren't already in progress or completed
-            if status in ['pending_review', 'needs_action']:
-                logging.info(f"Processing incoming task: {task_file.name}")
-
-                # Determine new status based on intelligent rules
-                new_status = self.process_task(task_file)
-
-                if new_status == 'awaiting_approval':
-                    # Task moved to approval workflows, skip further processing
-                    continue
-                elif new_status == 'in_progress':
-                    # Move to in-progress folder
-                    self.move_task_to_folder(task_file, in_progress_tasks_path)
-                    # Update the status in the new location
-                    new_task_path = in_progress_tasks_path / task_file.name
-                    self.update_task_metadata(new_task_path, {'status': 'in_progress'})
-                elif new_status == 'completed':
-                    # Move directly to completed
-                    self.move_task_to_folder(task_file, completed_tasks_path)
-                    # Update the status in the new location
-                    new_task_path = completed_tasks_path / task_file.name
-                    self.update_task_metadata(new_task_path, {'status': 'completed'})
-                elif new_status == 'failed':
-                    # Already moved to failed tasks by process_task
-                    pass
-                else:
-                    # Update status in current location
-                    self.update_task_metadata(task_file, {'status': new_status})
-
-        # Process in-progress tasks
-        in_progress_tasks = list(in_progress_tasks_path.glob('*.md'))
-        for task_file in in_progress_tasks:
-            metadata = self.get_task_metadata(task_file)
-            status = metadata.get('status', 'in_progress')
-
-            # Check if task should be completed
-            if status == 'in_progress':
-                # Apply intelligent rules to determine if task is completed
-                new_status = self.process_task(task_file)
-
-                if new_status == 'completed':
-                    # Move to completed folder
-                    self.move_task_to_folder(task_file, completed_tasks_path)
-                    # Update the status in the new location
-                    new_task_path = completed_tasks_path / task_file.name
-                    self.update_task_metadata(new_task_path, {'status': 'completed'})
-                elif new_status == 'awaiting_approval':
-                    # Move to approval workflows folder
-                    self.move_task_to_folder(task_file, approval_workflows_path)
-                elif new_status == 'failed':
-                    # Already moved to failed tasks by process_task
-                    pass
-                elif new_status == 'pending_review':
-                    # Move back to incoming for review
-                    self.move_task_to_folder(task_file, incoming_tasks_path)
-                    new_task_path = incoming_tasks_path / task_file.name
-                    self.update_task_metadata(new_task_path, {'status': 'pending_review'})
-
-        # Process approval workflows
-        approval_tasks = list(approval_workflows_path.glob('*.md'))
-        for task_file in approval_tasks:
-            metadata = self.get_task_metadata(task_file)
-
-            # Check if task has been approved
-            if metadata.get('approved', False):
-                logging.info(f"Approved task: {task_file.name}")
-
-                # Move to in-progress or completed based on original status
-                original_status = metadata.get('original_status', 'in_progress')
-
-                if original_status == 'completed':
-                    self.move_task_to_folder(task_file, completed_tasks_path)
-                    new_task_path = completed_tasks_path / task_file.name
-                    self.update_task_metadata(new_task_path, {'status': 'completed'})
-                else:
-                    self.move_task_to_folder(task_file, in_progress_tasks_path)
-                    new_task_path = in_progress_tasks_path / task_file.name
-                    self.update_task_metadata(new_task_path, {'status': 'in_progress'})
+        Returns:
+            The running watchdog observer, or None when watchdog is not installed
+        """
+        if Observer is None:
+            return None
+
+        wake_event = self._wake_event
+        own_paths = self._own_writes
+        not_own = object()
+        touched_folders = self._touched_folders
+
+        def is_own_write(path: str) -> bool:
+            """True while path is still exactly as the loop's own write or move left it"""
+            expected = own_paths.get(path, not_own)
+            if expected is not_own:
+                return False
+            if expected == OWN_WRITE_PENDING:
+                return True
+            try:
+                return os.stat(path).st_mtime_ns == expected
+            except OSError:
+                return expected is None
+
+        class _TaskFolderHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Reads (including the loop's own) do not change anything
+                if event.is_directory or event.event_type in ('opened', 'closed_no_write'):
+                    return
+                # Changes made by the loop itself must not trigger another cycle
+                paths = {event.src_path, getattr(event, 'dest_path', '') or event.src_path}
+                external = [path for path in paths if not is_own_write(path)]
+                if external:
+                    # Make the next cycle rescan these folders even if their mtime is unchanged
+                    touched_folders.update(os.path.dirname(path) for path in external)
+                    wake_event.set()
+
+        observer = Observer()
+        handler = _TaskFolderHandler()
+        for folder in (incoming_tasks_path, in_progress_tasks_path, approval_workflows_path):
+            folder.mkdir(parents=True, exist_ok=True)
+            observer.schedule(handler, str(folder), recursive=False)
+        observer.start()
+        self._watching = True
+        logging.info("Watching task folders for changes")
+        return observer
+
+    def wait_for_next_cycle(self, timeout: float):
+        """Sleep until a watched folder changes or the timeout expires"""
+        self._wake_event.wait(timeout)
+        self._wake_event.clear()
+
+    def classify_error(self, error: Exception, consecutive_failures: int = 0) -> str:
+        """
+        Decide how run_with_retry should react to a failed cycle
+
+        Args:
+            error (Exception): Exception raised by the cycle
+            consecutive_failures (int): Failed cycles immediately before this one
+
+        Returns:
+            str: 'halt' for errors retrying cannot fix (unreadable or missing
+                vault, repeated unexpected errors), 'retry_now' for parse errors
+                on files caught mid-write, 'retry_backoff' otherwise
+        """
+        # A single file locked by an editor or antivirus is retried; only an
+        # unreadable vault root stops the loop
+        if isinstance(error, PermissionError) and not os.access(VAULT_PATH, os.R_OK | os.X_OK):
+            return 'halt'
+        if isinstance(error, FileNotFoundError) and not Path(VAULT_PATH).exists():
+            return 'halt'
+        if isinstance(error, (yaml.YAMLError, json.JSONDecodeError)):
+            return 'retry_now'
+        if not isinstance(error, OSError) and consecutive_failures >= MAX_UNEXPECTED_FAILURES:
+            return 'halt'
+        return 'retry_backoff'
 
     def run_with_retry(self, max_cycles: int = None):
         """
         Run the Ralph Loop with retry capability
 
+        With watchdog installed the loop wakes on folder changes and only
+        falls back to a periodic rescan every WATCH_RESCAN_INTERVAL seconds;
+        otherwise it polls every POLL_INTERVAL seconds. A cycle that moved
+        tasks while others are still pending is followed straight away.
+
         Args:
             max_cycles (int): Maximum number of cycles to run (None for infinite)
         """
         cycle_count = 0
+        consecutive_failures = 0
+        observer = self.start_folder_watch()
+        interval = WATCH_RESCAN_INTERVAL if observer else POLL_INTERVAL
 
-        while max_cycles is None or cycle_count < max_cycles:
-            try:
-                self.run_autonomous_cycle()
-
-                # Wait before next cycle
-                time.sleep(30)  # Check every 30 seconds
-
-                cycle_count += 1
-            except KeyboardInterrupt:
-                logging.info("Ralph Loop interrupted by user")
-                break
-            except Exception as e:
-                logging.error(f"Error in Ralph Loop: {e}")
-                time.sleep(60)  # Wait a minute before retrying after error
+        try:
+            while max_cycles is None or cycle_count < max_cycles:
+                try:
+                    counts = self.run_autonomous_cycle()
+                    consecutive_failures = 0
+
+                    # Wait before next cycle; go again almost at once while moved tasks still wait
+                    if counts['processed'] and counts['still_pending']:
+                        self.wait_for_next_cycle(BUSY_POLL_INTERVAL)
+                    else:
+                        self.wait_for_next_cycle(interval)
+
+                    cycle_count += 1
+                except KeyboardInterrupt:
+                    logging.info("Ralph Loop interrupted by user")
+                    break
+                except Exception as e:
+                    action = self.classify_error(e, consecutive_failures)
+                    if action == 'halt':
+                        logging.critical(f"Unrecoverable error in Ralph Loop, stopping: {e}")
+                        break
+                    if action == 'retry_now':
+                        delay = PARSE_ERROR_RETRY_DELAY
+                    else:
+                        # Back off exponentially (with jitter) while the error persists
+                        delay = min(ERROR_RETRY_DELAY * (2 ** consecutive_failures), MAX_ERROR_RETRY_DELAY)
+                        delay *= random.uniform(0.8, 1.2)
+                    consecutive_failures += 1
+                    logging.error(f"Error in Ralph Loop: {e} (retrying in {delay:.0f}s)")
+                    time.sleep(delay)
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+                self._watching = False
 
 def main():
     """Main function to run the Ralph Loop"""
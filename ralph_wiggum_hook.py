@@ -42,7 +42,7 @@ def load_state() -> dict:
         try:
             with open(STATE_FILE, "r") as f:
                 return json.load(f)
-        except Exception:
+        except (OSError, ValueError):
             pass
     return {}
 
@@ -54,24 +54,57 @@ def save_state(state: dict):
         json.dump(state, f, indent=2)
 
 
-def is_task_complete(task_id: str) -> bool:
+def _md_file_names(folder: Path):
+    """Yield the names of the .md files in a folder (nothing if it is missing)."""
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    yield entry.name
+    except FileNotFoundError:
+        return
+
+
+def _folder_mtime(folder: Path) -> int:
+    """Directory mtime in ns, or 0 if the folder is missing."""
+    try:
+        return os.stat(folder).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def is_task_complete(task_id: str, state: dict = None) -> bool:
     """
     Check if a task has reached a terminal state (completed or done folder).
     Returns True if the task is finished.
+
+    When a state dict is passed, the "no pending tasks" answer is cached in
+    it against the folder mtimes, so repeated hook calls skip the directory
+    scan while Incoming/In_Progress are unchanged.
     """
     if not task_id:
         # No specific task tracked — check if any tasks remain in incoming/in_progress
-        incoming = list(INCOMING_FOLDER.glob("*.md")) if INCOMING_FOLDER.exists() else []
-        in_progress = list(IN_PROGRESS_FOLDER.glob("*.md")) if IN_PROGRESS_FOLDER.exists() else []
-        return len(incoming) == 0 and len(in_progress) == 0
+        mtimes = [_folder_mtime(INCOMING_FOLDER), _folder_mtime(IN_PROGRESS_FOLDER)]
+        cached = (state or {}).get("pending_check")
+        if cached and cached.get("mtimes") == mtimes:
+            return cached["complete"]
+
+        complete = all(
+            next(_md_file_names(folder), None) is None
+            for folder in (INCOMING_FOLDER, IN_PROGRESS_FOLDER)
+        )
+        if state is not None:
+            state["pending_check"] = {"mtimes": mtimes, "complete": complete}
+        return complete
 
     # Check if task file exists in completion folders
     for folder in [COMPLETED_FOLDER, DONE_FOLDER]:
-        if folder.exists():
-            # Match by task_id prefix
-            matches = list(folder.glob(f"{task_id}*.md")) + list(folder.glob(f"*{task_id}*.md"))
-            if matches:
-                return True
+        # Exact file name first: a single stat instead of a directory scan
+        if (folder / f"{task_id}.md").exists():
+            return True
+        # Match by task_id anywhere in the file name
+        if any(task_id in name for name in _md_file_names(folder)):
+            return True
 
     return False
 
@@ -83,8 +116,8 @@ def build_continuation_prompt(state: dict) -> str:
     iteration = state.get("iteration", 1)
 
     # Count current tasks
-    incoming_count = len(list(INCOMING_FOLDER.glob("*.md"))) if INCOMING_FOLDER.exists() else 0
-    in_progress_count = len(list(IN_PROGRESS_FOLDER.glob("*.md"))) if IN_PROGRESS_FOLDER.exists() else 0
+    incoming_count = sum(1 for _ in _md_file_names(INCOMING_FOLDER))
+    in_progress_count = sum(1 for _ in _md_file_names(IN_PROGRESS_FOLDER))
 
     prompt = f"""[RALPH WIGGUM LOOP - Iteration {iteration}/{MAX_ITERATIONS}]
 
@@ -137,7 +170,7 @@ def main():
         sys.exit(0)
 
     # Check if task is complete by file presence
-    if is_task_complete(task_id):
+    if is_task_complete(task_id, state):
         state["active"] = False
         state["completed"] = True
         state["completed_at"] = datetime.now().isoformat()
@@ -6,6 +6,7 @@ This module continuously scans for risks and generates risk reports.
 """
 
 import os
+import re
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -13,6 +14,15 @@ import yaml
 import json
 from typing import Dict, List, Optional
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from flat_yaml import parse_flat_yaml
 
 # Configuration constants
 VAULT_PATH = r"C:\Users\laptop world\Desktop\Hack00"
@@ -35,54 +45,172 @@ approval_workflows_path = Path(VAULT_PATH) / APPROVAL_WORKFLOWS_FOLDER
 logs_path = Path(VAULT_PATH) / LOGS_FOLDER
 memory_path = Path(VAULT_PATH) / MEMORY_FOLDER
 
+# Bytes read from the top of a task file when looking for its frontmatter
+_FRONTMATTER_HEAD_BYTES = 4096
+
+def _parse_frontmatter(block: str):
+    """Parse a frontmatter block, using PyYAML only when it is not flat"""
+    metadata = parse_flat_yaml(block)
+    if metadata is None:
+        return yaml.safe_load(block)
+    # yaml.safe_load gives None for a block of only blank and comment lines
+    return metadata or None
+
+# Markdown block for one risk in the report; fields missing from the risk render as N/A
+RISK_TEMPLATE = (
+    "\n### {type_title}: {task_file}\n"
+    "- **Type**: {type}\n"
+    "- **Severity**: {severity_upper}\n"
+    "- **Details**: \n"
+    "  - Task Type: {task_type}\n"
+    "  - Priority: {priority}\n"
+    "{detail}"
+    "  - Confidence: {confidence}\n"
+)
+
+# Extra detail line shown for each risk type; missing numbers render as 0
+RISK_DETAIL_TEMPLATES = {
+    'task_delay': "  - Age: {age_hours} hours\n",
+    'task_failure': "  - Retry Count: {retry_count}\n",
+    'approval_bottleneck': "  - Waiting for: {age_hours} hours\n",
+    'high_retry_activity': "  - Retry Count: {retry_count}\n",
+}
+
+class _RiskFields(dict):
+    """Risk fields for RISK_TEMPLATE.format_map"""
+    missing = 'N/A'
+
+    def __missing__(self, key):
+        return self.missing
+
+class _RiskDetailFields(_RiskFields):
+    """Risk fields for RISK_DETAIL_TEMPLATES"""
+    missing = 0
+
+# Retry logs older than this (in seconds) are not analyzed
+RETRY_LOG_MAX_AGE = 7 * 24 * 3600
+
+# Dated retry log name; group 1 is YYYYMMDD
+_RETRY_LOG_DATE_RE = re.compile(r'retry_log_([0-9]{8})\.json\Z')
+
+# read_task_metadata result for a file without a frontmatter block
+_NO_FRONTMATTER = object()
+
+def _read_frontmatter(task_file: str) -> Optional[str]:
+    """
+    Return the text between a task file's leading "---" and the next "---"
+
+    Only the head of the file is read (more only if the closing marker is not
+    in it). Returns None when the file does not start with a frontmatter block.
+    """
+    with open(task_file, 'rb') as f:
+        head = f.read(_FRONTMATTER_HEAD_BYTES)
+        if not head.startswith(b'---'):
+            return None
+        end = head.find(b'---', 3)
+        if end == -1:
+            head += f.read()
+            end = head.find(b'---', 3)
+            if end == -1:
+                return None
+    return head[3:end].decode('utf-8')
+
+_get_task_file = itemgetter('task_file')
+
+def _count_retry_entries(log_file: str) -> Counter:
+    """
+    Count the entries of a retry log (a JSON array) per task file
+
+    With ijson installed the array is streamed one entry at a time, so
+    memory stays flat however large the log grows.
+    """
+    with open(log_file, 'rb') as f:
+        logs = ijson.items(f, 'item') if ijson is not None else json.load(f)
+        return Counter(map(_get_task_file, logs))
+
+def _iter_entries(folder: Path, suffix: str = '.md', prefix: str = ''):
+    """
+    Yield the DirEntry of each matching file in a folder with one directory scan
+
+    The file-type check uses the dirent type, and callers only stat() the
+    entries whose mtime they need. Scanners pass entry.path on as a str
+    rather than building a Path per file. Like Path.glob, dotfiles are
+    listed too; a missing folder yields nothing.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(suffix) and name.startswith(prefix) and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
 class RiskRadar:
     def __init__(self):
+        # Parsed frontmatter keyed by path -> (mtime_ns, size, metadata)
+        self._metadata_cache: Dict[str, tuple] = {}
         self.setup_reports_directory()
 
     def setup_reports_directory(self):
         """Create reports directory if it doesn't exist"""
         reports_path.mkdir(parents=True, exist_ok=True)
 
+    def read_task_metadata(self, entry: os.DirEntry):
+        """
+        Parse a task file's frontmatter, reusing the cached parse while the
+        file's mtime and size are unchanged
+
+        Returns:
+            The parsed frontmatter, or _NO_FRONTMATTER if the file has none
+
+        Raises:
+            yaml.YAMLError: If the frontmatter is malformed
+        """
+        st = entry.stat()
+        cached = self._metadata_cache.get(entry.path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        yaml_content = _read_frontmatter(entry.path)
+        metadata = _NO_FRONTMATTER if yaml_content is None else _parse_frontmatter(yaml_content)
+        self._metadata_cache[entry.path] = (st.st_mtime_ns, st.st_size, metadata)
+        return metadata
+
     def scan_failed_tasks(self) -> List[Dict]:
         """Scan for failed tasks and analyze patterns"""
         failed_risks = []
         
-        if failed_tasks_path.exists():
-            for task_file in failed_tasks_path.glob('*.md'):
+        for entry in _iter_entries(failed_tasks_path):
+            try:
+                # Parse metadata (cached while the file is unchanged)
                 try:
-                    with open(task_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    metadata = self.read_task_metadata(entry)
+                except yaml.YAMLError:
+                    continue
+                if metadata is not _NO_FRONTMATTER:
+                    risk = {
+                        'type': 'task_failure',
+                        'task_file': entry.name,
+                        'task_type': metadata.get('type', 'unknown'),
+                        'priority': metadata.get('priority', 'normal'),
+                        'retry_count': metadata.get('retry_count', 0),
+                        'failure_reason': metadata.get('failure_reason', 'unknown'),
+                        'last_updated': metadata.get('last_updated', 'unknown'),
+                        'confidence': 0.8
+                    }
+                    
+                    # Calculate risk level based on retry count and priority
+                    if risk['retry_count'] > 5:
+                        risk['severity'] = 'high'
+                    elif risk['retry_count'] > 2:
+                        risk['severity'] = 'medium'
+                    else:
+                        risk['severity'] = 'low'
                     
-                    # Parse metadata
-                    if content.startswith("---"):
-                        parts = content.split("---", 2)
-                        if len(parts) >= 3:
-                            yaml_content = parts[1]
-                            try:
-                                metadata = yaml.safe_load(yaml_content)
-                                
-                                risk = {
-                                    'type': 'task_failure',
-                                    'task_file': task_file.name,
-                                    'task_type': metadata.get('type', 'unknown'),
-                                    'priority': metadata.get('priority', 'normal'),
-                                    'retry_count': metadata.get('retry_count', 0),
-                                    'failure_reason': metadata.get('failure_reason', 'unknown'),
-                                    'last_updated': metadata.get('last_updated', 'unknown'),
-                                    'confidence': 0.8
-                                }
-                                
-                                # Calculate risk level based on retry count and priority
-                                if risk['retry_count'] > 5:
-                                    risk['severity'] = 'high'
-                                elif risk['retry_count'] > 2:
-                                    risk['severity'] = 'medium'
-                                else:
-                                    risk['severity'] = 'low'
-                                
-                                failed_risks.append(risk)
-                            except yaml.YAMLError:
-                                continue
+                    failed_risks.append(risk)
+            except Exception as e:
+                print(f"Error analyzing failed task {entry.path}: {e}")
         
         return failed_risks
 
@@ -91,50 +219,45 @@ class RiskRadar:
         delayed_risks = []
         
         # Check in-progress tasks that have been there too long
-        if in_progress_tasks_path.exists():
-            for task_file in in_progress_tasks_path.glob('*.md'):
+        now_ts = time.time()
+        for entry in _iter_entries(in_progress_tasks_path):
+            try:
+                # Age since the file was last modified
+                age_hours = (now_ts - entry.stat().st_mtime) / 3600
+                
+                # Consider tasks in progress for more than 24 hours as potentially delayed;
+                # younger ones are skipped before their file is opened
+                if age_hours <= 24:
+                    continue
+                
+                # Parse metadata (cached while the file is unchanged)
                 try:
-                    # Get file modification time
-                    mod_time = datetime.fromtimestamp(task_file.stat().st_mtime)
-                    age_hours = (datetime.now() - mod_time).total_seconds() / 3600
+                    metadata = self.read_task_metadata(entry)
+                except yaml.YAMLError:
+                    continue
+                if metadata is not _NO_FRONTMATTER:
+                    risk = {
+                        'type': 'task_delay',
+                        'task_file': entry.name,
+                        'task_type': metadata.get('type', 'unknown'),
+                        'priority': metadata.get('priority', 'normal'),
+                        'age_hours': round(age_hours, 2),
+                        'status': metadata.get('status', 'in_progress'),
+                        'assigned_to': metadata.get('assigned_to', 'system'),
+                        'confidence': 0.7
+                    }
                     
-                    with open(task_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    # Severity based on age
+                    if age_hours > 72:
+                        risk['severity'] = 'high'
+                    elif age_hours > 24:
+                        risk['severity'] = 'medium'
+                    else:
+                        risk['severity'] = 'low'
                     
-                    # Parse metadata
-                    if content.startswith("---"):
-                        parts = content.split("---", 2)
-                        if len(parts) >= 3:
-                            yaml_content = parts[1]
-                            try:
-                                metadata = yaml.safe_load(yaml_content)
-                                
-                                # Consider tasks in progress for more than 24 hours as potentially delayed
-                                if age_hours > 24:
-                                    risk = {
-                                        'type': 'task_delay',
-                                        'task_file': task_file.name,
-                                        'task_type': metadata.get('type', 'unknown'),
-                                        'priority': metadata.get('priority', 'normal'),
-                                        'age_hours': round(age_hours, 2),
-                                        'status': metadata.get('status', 'in_progress'),
-                                        'assigned_to': metadata.get('assigned_to', 'system'),
-                                        'confidence': 0.7
-                                    }
-                                    
-                                    # Severity based on age
-                                    if age_hours > 72:
-                                        risk['severity'] = 'high'
-                                    elif age_hours > 24:
-                                        risk['severity'] = 'medium'
-                                    else:
-                                        risk['severity'] = 'low'
-                                    
-                                    delayed_risks.append(risk)
-                            except yaml.YAMLError:
-                                continue
-                except Exception as e:
-                    print(f"Error analyzing delayed task {task_file}: {e}")
+                    delayed_risks.append(risk)
+            except Exception as e:
+                print(f"Error analyzing delayed task {entry.path}: {e}")
         
         return delayed_risks
 
@@ -142,48 +265,40 @@ class RiskRadar:
         """Scan for approval bottlenecks"""
         bottleneck_risks = []
         
-        if approval_workflows_path.exists():
-            for task_file in approval_workflows_path.glob('*.md'):
+        now_ts = time.time()
+        for entry in _iter_entries(approval_workflows_path):
+            try:
+                # Age since the file was last modified
+                age_hours = (now_ts - entry.stat().st_mtime) / 3600
+                
+                # Parse metadata (cached while the file is unchanged)
                 try:
-                    # Get file modification time
-                    mod_time = datetime.fromtimestamp(task_file.stat().st_mtime)
-                    age_hours = (datetime.now() - mod_time).total_seconds() / 3600
+                    metadata = self.read_task_metadata(entry)
+                except yaml.YAMLError:
+                    continue
+                if metadata is not _NO_FRONTMATTER:
+                    risk = {
+                        'type': 'approval_bottleneck',
+                        'task_file': entry.name,
+                        'task_type': metadata.get('type', 'unknown'),
+                        'priority': metadata.get('priority', 'normal'),
+                        'age_hours': round(age_hours, 2),
+                        'requester': metadata.get('requester', 'system'),
+                        'approval_required_by': metadata.get('approval_required_by', 'unknown'),
+                        'confidence': 0.9
+                    }
                     
-                    with open(task_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    # Severity based on age
+                    if age_hours > 48:
+                        risk['severity'] = 'high'
+                    elif age_hours > 12:
+                        risk['severity'] = 'medium'
+                    else:
+                        risk['severity'] = 'low'
                     
-                    # Parse metadata
-                    if content.startswith("---"):
-                        parts = content.split("---", 2)
-                        if len(parts) >= 3:
-                            yaml_content = parts[1]
-                            try:
-                                metadata = yaml.safe_load(yaml_content)
-                                
-                                risk = {
-                                    'type': 'approval_bottleneck',
-                                    'task_file': task_file.name,
-                                    'task_type': metadata.get('type', 'unknown'),
-                                    'priority': metadata.get('priority', 'normal'),
-                                    'age_hours': round(age_hours, 2),
-                                    'requester': metadata.get('requester', 'system'),
-                                    'approval_required_by': metadata.get('approval_required_by', 'unknown'),
-                                    'confidence': 0.9
-                                }
-                                
-                                # Severity based on age
-                                if age_hours > 48:
-                                    risk['severity'] = 'high'
-                                elif age_hours > 12:
-                                    risk['severity'] = 'medium'
-                                else:
-                                    risk['severity'] = 'low'
-                                
-                                bottleneck_risks.append(risk)
-                            except yaml.YAMLError:
-                                continue
-                except Exception as e:
-                    print(f"Error analyzing approval bottleneck {task_file}: {e}")
+                    bottleneck_risks.append(risk)
+            except Exception as e:
+                print(f"Error analyzing approval bottleneck {entry.path}: {e}")
         
         return bottleneck_risks
 
@@ -191,19 +306,22 @@ class RiskRadar:
         """Analyze retry logs for patterns"""
         retry_risks = []
         
-        # Look for recent retry logs
-        for log_file in logs_path.glob("retry_log_*.json"):
+        # Look for recent retry logs. Each log is only written on the day in its
+        # name (retry_log_YYYYMMDD.json), so one dated before the cutoff day is
+        # older than 7 days and can be skipped without a stat
+        now_ts = time.time()
+        cutoff = int((datetime.now() - timedelta(days=7)).strftime('%Y%m%d'))
+        for entry in _iter_entries(logs_path, suffix='.json', prefix='retry_log_'):
+            dated = _RETRY_LOG_DATE_RE.match(entry.name)
+            if dated and int(dated.group(1)) < cutoff:
+                continue
             try:
                 # Check if this is a recent log file (last 7 days)
-                mod_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-                if datetime.now() - mod_time > timedelta(days=7):
+                if now_ts - entry.stat().st_mtime > RETRY_LOG_MAX_AGE:
                     continue
                 
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-                
                 # Group by task file and count retries
-                retry_counts = Counter(log['task_file'] for log in logs)
+                retry_counts = _count_retry_entries(entry.path)
                 
                 for task_file, count in retry_counts.items():
                     if count > 5:  # Significant retry activity
@@ -211,7 +329,7 @@ class RiskRadar:
                             'type': 'high_retry_activity',
                             'task_file': task_file,
                             'retry_count': count,
-                            'log_file': log_file.name,
+                            'log_file': entry.name,
                             'confidence': 0.8
                         }
                         
@@ -225,7 +343,7 @@ class RiskRadar:
                         
                         retry_risks.append(risk)
             except Exception as e:
-                print(f"Error analyzing retry log {log_file}: {e}")
+                print(f"Error analyzing retry log {entry.path}: {e}")
         
         return retry_risks
 
@@ -246,13 +364,37 @@ class RiskRadar:
         
         return categorized
 
+    def format_risk(self, risk: Dict) -> str:
+        """Render one risk as a markdown block"""
+        detail_line = RISK_DETAIL_TEMPLATES.get(risk['type'], "").format_map(_RiskDetailFields(risk))
+        fields = _RiskFields(
+            risk,
+            type_title=risk['type'].replace('_', ' ').title(),
+            severity_upper=risk['severity'].upper(),
+            detail=detail_line,
+        )
+        fields.setdefault('confidence', 0.5)
+        return RISK_TEMPLATE.format_map(fields)
+
+    def format_risk_section(self, severity: str, risks: List[Dict]) -> str:
+        """Render the report section for one severity level"""
+        parts = [f"\n## {severity.title()} Severity Risks\n"]
+        parts.extend(self.format_risk(risk) for risk in risks)
+        if not risks:
+            parts.append(f"- No {severity} severity risks identified\n")
+        return "".join(parts)
+
     def generate_risk_report(self) -> str:
         """Generate a comprehensive risk report"""
-        # Scan for all types of risks
-        failed_risks = self.scan_failed_tasks()
-        delayed_risks = self.scan_delayed_tasks()
-        bottleneck_risks = self.scan_approval_bottlenecks()
-        retry_risks = self.analyze_retry_logs()
+        # Scan for all types of risks; the scanners read disjoint folders, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            scans = [executor.submit(scanner) for scanner in (
+                self.scan_failed_tasks,
+                self.scan_delayed_tasks,
+                self.scan_approval_bottlenecks,
+                self.analyze_retry_logs,
+            )]
+            failed_risks, delayed_risks, bottleneck_risks, retry_risks = [scan.result() for scan in scans]
         
         # Combine all risks
         all_risks = failed_risks + delayed_risks + bottleneck_risks + retry_risks
@@ -261,7 +403,7 @@ class RiskRadar:
         categorized_risks = self.categorize_risks(all_risks)
         
         # Generate report content
-        report_content = f"""# Risk Radar Report
+        header = f"""# Risk Radar Report
 
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -270,91 +412,9 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - **High Severity**: {len(categorized_risks['high'])}
 - **Medium Severity**: {len(categorized_risks['medium'])}
 - **Low Severity**: {len(categorized_risks['low'])}
-
-## High Severity Risks
 """
-        
-        if categorized_risks['high']:
-            for risk in categorized_risks['high']:
-                report_content += f"""
-### {risk['type'].replace('_', ' ').title()}: {risk['task_file']}
-- **Type**: {risk['type']}
-- **Severity**: {risk['severity'].upper()}
-- **Details**: 
-  - Task Type: {risk.get('task_type', 'N/A')}
-  - Priority: {risk.get('priority', 'N/A')}
-"""
-                if risk['type'] == 'task_delay':
-                    report_content += f"  - Age: {risk.get('age_hours', 0)} hours\n"
-                elif risk['type'] == 'task_failure':
-                    report_content += f"  - Retry Count: {risk.get('retry_count', 0)}\n"
-                elif risk['type'] == 'approval_bottleneck':
-                    report_content += f"  - Waiting for: {risk.get('age_hours', 0)} hours\n"
-                elif risk['type'] == 'high_retry_activity':
-                    report_content += f"  - Retry Count: {risk.get('retry_count', 0)}\n"
-                
-                report_content += f"  - Confidence: {risk.get('confidence', 0.5)}\n"
-        else:
-            report_content += "- No high severity risks identified\n"
-        
-        report_content += f"""
-
-## Medium Severity Risks
-"""
-        
-        if categorized_risks['medium']:
-            for risk in categorized_risks['medium']:
-                report_content += f"""
-### {risk['type'].replace('_', ' ').title()}: {risk['task_file']}
-- **Type**: {risk['type']}
-- **Severity**: {risk['severity'].upper()}
-- **Details**: 
-  - Task Type: {risk.get('task_type', 'N/A')}
-  - Priority: {risk.get('priority', 'N/A')}
-"""
-                if risk['type'] == 'task_delay':
-                    report_content += f"  - Age: {risk.get('age_hours', 0)} hours\n"
-                elif risk['type'] == 'task_failure':
-                    report_content += f"  - Retry Count: {risk.get('retry_count', 0)}\n"
-                elif risk['type'] == 'approval_bottleneck':
-                    report_content += f"  - Waiting for: {risk.get('age_hours', 0)} hours\n"
-                elif risk['type'] == 'high_retry_activity':
-                    report_content += f"  - Retry Count: {risk.get('retry_count', 0)}\n"
-                
-                report_content += f"  - Confidence: {risk.get('confidence', 0.5)}\n"
-        else:
-            report_content += "- No medium severity risks identified\n"
-        
-        report_content += f"""
-
-## Low Severity Risks
-"""
-        
-        if categorized_risks['low']:
-            for risk in categorized_risks['low']:
-                report_content += f"""
-### {risk['type'].replace('_', ' ').title()}: {risk['task_file']}
-- **Type**: {risk['type']}
-- **Severity**: {risk['severity'].upper()}
-- **Details**: 
-  - Task Type: {risk.get('task_type', 'N/A')}
-  - Priority: {risk.get('priority', 'N/A')}
-"""
-                if risk['type'] == 'task_delay':
-                    report_content += f"  - Age: {risk.get('age_hours', 0)} hours\n"
-                elif risk['type'] == 'task_failure':
-                    report_content += f"  - Retry Count: {risk.get('retry_count', 0)}\n"
-                elif risk['type'] == 'approval_bottleneck':
-                    report_content += f"  - Waiting for: {risk.get('age_hours', 0)} hours\n"
-                elif risk['type'] == 'high_retry_activity':
-                    report_content += f"  - Retry Count: {risk.get('retry_count', 0)}\n"
-                
-                report_content += f"  - Confidence: {risk.get('confidence', 0.5)}\n"
-        else:
-            report_content += "- No low severity risks identified\n"
-        
-        report_content += f"""
 
+        footer = """
 ## Recommendations
 Based on the identified risks, the following actions are recommended:
 
@@ -366,14 +426,22 @@ Based on the identified risks, the following actions are recommended:
 ---
 *Automatically generated by Risk Radar System*
 """
+
+        sections = [self.format_risk_section(severity, categorized_risks[severity])
+                    for severity in ('high', 'medium', 'low')]
+        report_content = header + "\n".join(sections + [footer])
         
         return report_content
 
     def save_risk_report(self, content: str):
         """Save the risk report to a file"""
         report_file = reports_path / f"Risk_Radar_{datetime.now().strftime('%Y%m%d')}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and write the whole report in a single binary write, keeping
+        # the platform line endings text mode would have produced
+        if os.linesep != '\n':
+            content = content.replace('\n', os.linesep)
+        with open(report_file, 'wb') as f:
+            f.write(content.encode('utf-8'))
         
         print(f"Risk radar report saved to: {report_file}")
         return report_file
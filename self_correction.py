@@ -6,6 +6,8 @@ This module implements self-correction when tasks fail repeatedly,
 analyzing failures and adjusting processing strategies automatically.
 """
 
+import copy
+import mmap
 import os
 import time
 from pathlib import Path
@@ -13,6 +15,21 @@ from datetime import datetime
 import yaml
 import json
 from typing import Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from flat_yaml import dump_flat_yaml, parse_flat_yaml
 
 # Configuration constants
 VAULT_PATH = r"C:\Users\laptop world\Desktop\Hack00"
@@ -31,19 +48,90 @@ failed_tasks_path = Path(VAULT_PATH) / FAILED_TASKS_FOLDER
 memory_path = Path(VAULT_PATH) / MEMORY_FOLDER
 logs_path = Path(VAULT_PATH) / LOGS_FOLDER
 
+# Worker threads used to read and parse retry logs concurrently
+MAX_WORKERS = 8
+
+# os.rename accepts directory fds (POSIX); there it also replaces an existing target like os.replace
+RENAME_SUPPORTS_DIR_FD = os.rename in os.supports_dir_fd
+
+# Read buffer for retry log files
+RETRY_LOG_BUFFER_SIZE = 1 << 20
+# Retry logs at least this large are memory-mapped and decoded in place when orjson is available
+RETRY_LOG_MMAP_MIN_SIZE = 64 * 1024
+
+# Body of the Memory/failure_analysis_<task>.md file written for each failing task
+FAILURE_ANALYSIS_TEMPLATE = """# Failure Analysis for {task_file}
+
+Generated: {generated}
+
+## Failure Summary
+- **Task Name**: {task_file}
+- **Number of Failed Attempts**: {attempt_count}
+- **Failure Threshold**: {failure_threshold} attempts
+
+## Failure Patterns Identified
+{attempt_lines}
+## Recommended Actions
+1. Review the task content and requirements
+2. Check for any external dependencies that might be causing failures
+3. Consider simplifying the task or breaking it into smaller components
+4. Evaluate if the task is still relevant and necessary
+
+## Next Steps
+- The system will attempt to process this task with an adjusted strategy
+- If continued failures occur, manual intervention may be required
+"""
+
+
+def json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_retry_log(log_file: str, size: int = 0) -> tuple:
+    """Read and decode one retry log; returns (entries, None) or (None, error)"""
+    try:
+        with open(log_file, 'rb', buffering=RETRY_LOG_BUFFER_SIZE) as f:
+            if orjson is not None and size >= RETRY_LOG_MMAP_MIN_SIZE:
+                # Decode straight from the page cache instead of copying the file into bytes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view), None
+            return json_loads(f.read()), None
+    except (OSError, ValueError) as e:
+        return None, e
+
+
 class SelfCorrectionMode:
+    # Folders already created by any instance in this process
+    _dirs_created = set()
+
     def __init__(self):
         self.failure_threshold = 3
+        # Retry log entries (in log order) and attempts per task file, and the log files they came from
+        self._retry_entries: List[Dict] = []
+        self._retry_counts = Counter()
+        self._retry_cache_key = None
+        # Parsed frontmatter per task path, with the (mtime_ns, size) it was read at
+        self._meta_cache: Dict[str, tuple] = {}
+        # Output folders as plain strings, joined with os.path.join in the per-task loops
+        self._memory_dir = str(memory_path)
+        self._failed_dir = str(failed_tasks_path)
         self.setup_failed_tasks_directory()
         self.setup_memory_directory()
 
     def setup_failed_tasks_directory(self):
         """Create failed tasks directory if it doesn't exist"""
-        failed_tasks_path.mkdir(parents=True, exist_ok=True)
+        if failed_tasks_path not in self._dirs_created:
+            failed_tasks_path.mkdir(parents=True, exist_ok=True)
+            self._dirs_created.add(failed_tasks_path)
 
     def setup_memory_directory(self):
         """Create memory directory if it doesn't exist"""
-        memory_path.mkdir(parents=True, exist_ok=True)
+        if memory_path not in self._dirs_created:
+            memory_path.mkdir(parents=True, exist_ok=True)
+            self._dirs_created.add(memory_path)
 
     def parse_yaml_frontmatter(self, content: str) -> tuple:
         """
@@ -62,7 +150,9 @@ class SelfCorrectionMode:
                 yaml_content = parts[1]
                 content_without_frontmatter = parts[2].strip()
                 try:
-                    yaml_data = yaml.safe_load(yaml_content)
+                    yaml_data = parse_flat_yaml(yaml_content)
+                    if yaml_data is None:
+                        yaml_data = yaml.load(yaml_content, Loader=YamlLoader)
                     return yaml_data, content_without_frontmatter
                 except yaml.YAMLError:
                     # If YAML parsing fails, return empty dict
@@ -73,6 +163,9 @@ class SelfCorrectionMode:
         """
         Get task metadata from YAML frontmatter
 
+        The parse is cached per path and reused while the file's mtime and
+        size are unchanged.
+
         Args:
             file_path (Path): Path to the task file
 
@@ -80,12 +173,20 @@ class SelfCorrectionMode:
             dict: Task metadata
         """
         try:
+            st = os.stat(file_path)
+            key = str(file_path)
+            cached = self._meta_cache.get(key)
+            if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+                return copy.copy(cached[1])
+
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
             yaml_data, _ = self.parse_yaml_frontmatter(content)
-            return yaml_data or {}
-        except Exception as e:
+            metadata = yaml_data or {}
+            self._meta_cache[key] = ((st.st_mtime_ns, st.st_size), metadata)
+            return copy.copy(metadata)
+        except (OSError, ValueError) as e:
             print(f"Error reading task metadata from {file_path}: {e}")
             return {}
 
@@ -93,6 +194,9 @@ class SelfCorrectionMode:
         """
         Update task metadata in YAML frontmatter
 
+        The new content is written to a temporary file next to the task and
+        swapped in with os.replace, so a crash never leaves a half-written task.
+
         Args:
             file_path (Path): Path to the task file
             updates (dict): Updates to apply to the metadata
@@ -113,128 +217,168 @@ class SelfCorrectionMode:
                 yaml_data['last_updated'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
 
                 # Reconstruct the file with updated YAML frontmatter
-                updated_content = "---\n" + yaml.dump(yaml_data, default_flow_style=False) + "---\n" + content_without_frontmatter
-
-                # Write the updated content back to the file
-                with open(file_path, 'w', encoding='utf-8') as f:
+                yaml_block = dump_flat_yaml(yaml_data, sort_keys=True, exact=True)
+                if yaml_block is None:
+                    yaml_block = yaml.dump(yaml_data, Dumper=YamlDumper, default_flow_style=False)
+                updated_content = "---\n" + yaml_block + "---\n" + content_without_frontmatter
+
+                # Write the updated content next to the task, then swap it in atomically
+                tmp_path = file_path.with_name(file_path.name + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
                     f.write(updated_content)
+                os.replace(tmp_path, file_path)
 
                 return True
             else:
                 print(f"No YAML frontmatter found in {file_path}")
                 return False
-        except Exception as e:
+        except (OSError, ValueError, TypeError, yaml.YAMLError) as e:
             print(f"Error updating task metadata in {file_path}: {e}")
             return False
 
-    def analyze_retry_logs(self) -> Dict[str, List[Dict]]:
-        """Analyze retry logs to identify frequently failing tasks"""
-        failure_analysis = {}
-        
-        # Look for all retry log files
-        for log_file in logs_path.glob("retry_log_*.json"):
+    def _load_all_retry_logs(self) -> List[Dict]:
+        """
+        Read every retry log once, keeping the entries that name a task file
+        and counting the attempts per task.
+
+        The result is cached against the name, mtime and size of each log
+        file, so the logs are only re-read when one of them changes.
+        """
+        # One directory scan; DirEntry.stat() reuses what the scan returned where it can
+        log_files = []
+        try:
+            with os.scandir(logs_path) as entries:
+                for entry in entries:
+                    if not (entry.name.startswith('retry_log_') and entry.name.endswith('.json')):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    log_files.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            pass
+
+        cache_key = tuple((log_file, mtime, size) for log_file, mtime, size in log_files)
+        if cache_key == self._retry_cache_key:
+            return self._retry_entries
+
+        # Parse the logs in worker threads, then collect the entries here in log order
+        paths = [log_file for log_file, _, _ in log_files]
+        sizes = [size for _, _, size in log_files]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths))) as executor:
+                results = list(executor.map(_read_retry_log, paths, sizes))
+        else:
+            results = [_read_retry_log(log_file, size) for log_file, size in zip(paths, sizes)]
+
+        retry_entries = []
+        retry_counts = Counter()
+        for log_file, (logs, error) in zip(paths, results):
+            if error is not None:
+                print(f"Error reading retry log {log_file}: {error}")
+                continue
             try:
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-                
-                # Group logs by task file
                 for log_entry in logs:
                     task_file = log_entry.get('task_file')
                     if task_file:
-                        if task_file not in failure_analysis:
-                            failure_analysis[task_file] = []
-                        failure_analysis[task_file].append(log_entry)
-            except Exception as e:
+                        retry_counts[task_file] += 1
+                        retry_entries.append(log_entry)
+            except (AttributeError, TypeError) as e:
                 print(f"Error reading retry log {log_file}: {e}")
-        
+
+        self._retry_entries = retry_entries
+        self._retry_counts = retry_counts
+        self._retry_cache_key = cache_key
+        return retry_entries
+
+    def _attempts_for_tasks(self, task_files) -> Dict[str, List[Dict]]:
+        """Group the logged attempts of the given task files in one pass over the entries"""
+        wanted = set(task_files)
+        attempts = {task_file: [] for task_file in task_files}
+        for log_entry in self._load_all_retry_logs():
+            if log_entry['task_file'] in wanted:
+                attempts[log_entry['task_file']].append(log_entry)
+        return attempts
+
+    def analyze_retry_logs(self) -> Dict[str, List[Dict]]:
+        """Analyze retry logs to identify frequently failing tasks"""
+        failure_analysis = {}
+        for log_entry in self._load_all_retry_logs():
+            failure_analysis.setdefault(log_entry['task_file'], []).append(log_entry)
         return failure_analysis
 
     def identify_failing_tasks(self) -> List[str]:
         """Identify tasks that have failed more than the threshold"""
-        failure_analysis = self.analyze_retry_logs()
-        failing_tasks = []
-        
-        for task_file, attempts in failure_analysis.items():
-            if len(attempts) >= self.failure_threshold:
-                failing_tasks.append(task_file)
-        
-        return failing_tasks
+        # Only the attempt counts are needed here, not the entries themselves
+        self._load_all_retry_logs()
+        return [task_file for task_file, count in self._retry_counts.items()
+                if count >= self.failure_threshold]
 
     def write_failure_analysis(self, failing_tasks: List[str]):
         """Write failure analysis for each failing task"""
-        for task_file in failing_tasks:
-            # Create analysis content
-            analysis_content = f"""# Failure Analysis for {task_file}
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        # One timestamp for the whole batch
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        attempts_by_task = self._attempts_for_tasks(failing_tasks)
 
-## Failure Summary
-- **Task Name**: {task_file}
-- **Number of Failed Attempts**: {len(self.get_attempts_for_task(task_file))}
-- **Failure Threshold**: {self.failure_threshold} attempts
-
-## Failure Patterns Identified
-"""
-            
-            attempts = self.get_attempts_for_task(task_file)
-            for i, attempt in enumerate(attempts, 1):
-                analysis_content += f"- Attempt {i}: {attempt.get('reason', 'Unknown reason')} at {attempt.get('timestamp', 'Unknown time')}\n"
-            
-            analysis_content += f"""
-## Recommended Actions
-1. Review the task content and requirements
-2. Check for any external dependencies that might be causing failures
-3. Consider simplifying the task or breaking it into smaller components
-4. Evaluate if the task is still relevant and necessary
-
-## Next Steps
-- The system will attempt to process this task with an adjusted strategy
-- If continued failures occur, manual intervention may be required
-"""
-
-            # Write analysis to file
-            analysis_file = memory_path / f"failure_analysis_{task_file.replace('.md', '')}.md"
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                f.write(analysis_content)
+        for task_file in failing_tasks:
+            attempts = attempts_by_task[task_file]
+
+            # Fill the template in one pass: the attempts block is joined, not grown with +=
+            attempt_lines = "".join(
+                f"- Attempt {i}: {attempt.get('reason', 'Unknown reason')} at {attempt.get('timestamp', 'Unknown time')}\n"
+                for i, attempt in enumerate(attempts, 1)
+            )
+            analysis_content = FAILURE_ANALYSIS_TEMPLATE.format(
+                task_file=task_file,
+                generated=generated,
+                attempt_count=len(attempts),
+                failure_threshold=self.failure_threshold,
+                attempt_lines=attempt_lines,
+            )
+
+            # Write analysis to file, encoded once and written with a single binary write
+            # (keeping the platform line endings text mode would have produced)
+            if os.linesep != '\n':
+                analysis_content = analysis_content.replace('\n', os.linesep)
+            stem = task_file[:-3] if task_file.endswith('.md') else task_file
+            analysis_file = os.path.join(self._memory_dir, f"failure_analysis_{stem}.md")
+            with open(analysis_file, 'wb') as f:
+                f.write(analysis_content.encode('utf-8'))
             
             print(f"Failure analysis written for {task_file}")
 
     def get_attempts_for_task(self, task_file: str) -> List[Dict]:
         """Get all attempts for a specific task from logs"""
-        all_attempts = []
-        
-        for log_file in logs_path.glob("retry_log_*.json"):
-            try:
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-                
-                for log_entry in logs:
-                    if log_entry.get('task_file') == task_file:
-                        all_attempts.append(log_entry)
-            except Exception as e:
-                print(f"Error reading retry log {log_file}: {e}")
-        
-        return all_attempts
+        return self._attempts_for_tasks([task_file])[task_file]
 
-    def adjust_processing_strategy(self, failing_tasks: List[str]):
+    def _build_task_index(self) -> Dict[str, Path]:
+        """
+        Map task file names to their paths in the incoming and in-progress folders.
+
+        Each folder is scanned once; a name present in both resolves to the
+        incoming copy, matching the order tasks are looked up in.
+        """
+        task_index = {}
+        for folder in (in_progress_tasks_path, incoming_tasks_path):
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.md'):
+                            task_index[entry.name] = Path(entry.path)
+            except FileNotFoundError:
+                continue
+        return task_index
+
+    def adjust_processing_strategy(self, failing_tasks: List[str], task_index: Optional[Dict[str, Path]] = None):
         """Adjust processing strategy for failing tasks"""
+        if task_index is None:
+            task_index = self._build_task_index()
+
         for task_file in failing_tasks:
             # Find the actual task file in the system
-            task_path = None
-            
-            # Check in incoming tasks
-            for file_path in incoming_tasks_path.glob('*.md'):
-                if file_path.name == task_file:
-                    task_path = file_path
-                    break
-            
-            # Check in progress tasks
-            if not task_path:
-                for file_path in in_progress_tasks_path.glob('*.md'):
-                    if file_path.name == task_file:
-                        task_path = file_path
-                        break
-            
+            task_path = task_index.get(task_file)
+
             if task_path:
                 # Get current metadata
                 metadata = self.get_task_metadata(task_path)
@@ -255,31 +399,42 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             else:
                 print(f"Could not find task file {task_file} to adjust strategy")
 
-    def move_persistent_failures(self, failing_tasks: List[str]):
-        """Move tasks that consistently fail to a special folder"""
-        for task_file in failing_tasks:
-            # Find the actual task file in the system
-            task_path = None
-            
-            # Check in incoming tasks
-            for file_path in incoming_tasks_path.glob('*.md'):
-                if file_path.name == task_file:
-                    task_path = file_path
-                    break
-            
-            # Check in progress tasks
-            if not task_path:
-                for file_path in in_progress_tasks_path.glob('*.md'):
-                    if file_path.name == task_file:
-                        task_path = file_path
-                        break
-            
-            if task_path:
-                # Move to failed tasks folder
-                destination_path = failed_tasks_path / task_path.name
-                task_path.rename(destination_path)
-                
-                print(f"Moved persistent failure {task_file} to failed tasks folder")
+    def move_persistent_failures(self, failing_tasks: List[str], task_index: Optional[Dict[str, Path]] = None):
+        """
+        Move tasks that consistently fail to a special folder
+
+        Moves use os.replace semantics, so an older copy of the same task in
+        the failed folder is overwritten on every platform. Where supported,
+        the folders are opened once and the renames are made relative to them.
+        """
+        if task_index is None:
+            task_index = self._build_task_index()
+
+        dir_fds = {}
+        try:
+            if RENAME_SUPPORTS_DIR_FD:
+                dir_fds[self._failed_dir] = os.open(self._failed_dir, os.O_RDONLY | os.O_DIRECTORY)
+
+            for task_file in failing_tasks:
+                # Find the actual task file in the system
+                task_path = task_index.get(task_file)
+
+                if task_path:
+                    # Move to failed tasks folder
+                    if RENAME_SUPPORTS_DIR_FD:
+                        source_dir = str(task_path.parent)
+                        if source_dir not in dir_fds:
+                            dir_fds[source_dir] = os.open(source_dir, os.O_RDONLY | os.O_DIRECTORY)
+                        os.rename(task_path.name, task_path.name,
+                                  src_dir_fd=dir_fds[source_dir],
+                                  dst_dir_fd=dir_fds[self._failed_dir])
+                    else:
+                        os.replace(task_path, os.path.join(self._failed_dir, task_path.name))
+
+                    print(f"Moved persistent failure {task_file} to failed tasks folder")
+        finally:
+            for fd in dir_fds.values():
+                os.close(fd)
 
     def run_self_correction_cycle(self):
         """Run one cycle of self-correction analysis"""
@@ -293,15 +448,44 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             
             # Write failure analysis for each
             self.write_failure_analysis(failing_tasks)
-            
+
+            # Locate the task files once for both steps below, and leave out tasks
+            # whose files are already gone (moved on an earlier cycle or cleaned up)
+            task_index = self._build_task_index()
+            present_tasks = [task_file for task_file in failing_tasks if task_file in task_index]
+            missing_count = len(failing_tasks) - len(present_tasks)
+            if missing_count:
+                print(f"Skipping {missing_count} failing tasks no longer in the incoming or in-progress folders")
+
             # Adjust processing strategies
-            self.adjust_processing_strategy(failing_tasks)
+            self.adjust_processing_strategy(present_tasks, task_index)
             
             # Move persistent failures to special folder
-            self.move_persistent_failures(failing_tasks)
+            self.move_persistent_failures(present_tasks, task_index)
         else:
             print("No tasks found with repeated failures")
 
+# Instance reused by run_cycle_once, so its retry-log and metadata caches carry over between ticks
+_shared_correction: Optional[SelfCorrectionMode] = None
+
+def run_cycle_once(correction: Optional[SelfCorrectionMode] = None) -> SelfCorrectionMode:
+    """
+    Run one self-correction cycle for a scheduler or driver loop
+
+    Args:
+        correction: Instance to run; defaults to one shared across calls
+
+    Returns:
+        SelfCorrectionMode: The instance used, for the caller to pass back in
+    """
+    global _shared_correction
+    if correction is None:
+        if _shared_correction is None:
+            _shared_correction = SelfCorrectionMode()
+        correction = _shared_correction
+    correction.run_self_correction_cycle()
+    return correction
+
 def main():
     """Main function to run the self-correction mode"""
     print("="*60)
@@ -309,8 +493,7 @@ def main():
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*60)
     
-    correction = SelfCorrectionMode()
-    correction.run_self_correction_cycle()
+    run_cycle_once()
     
     print(f"[{datetime.now().strftime('%H:%M:%S')}] Self-correction cycle completed")
 
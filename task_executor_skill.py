@@ -16,6 +16,12 @@ from typing import Dict, List, Optional, Tuple
 import yaml
 import logging
 
+# libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -241,7 +247,7 @@ class TaskExecutorSkill:
             task_metadata['risk_factors'] = risk_factors
         
         # Build YAML frontmatter
-        yaml_content = yaml.dump(task_metadata, default_flow_style=False, allow_unicode=True)
+        yaml_content = yaml.dump(task_metadata, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
         
         # Create full task content
         full_content = f"---\n{yaml_content}---\n\n{task_content}"